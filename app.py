@@ -1,7 +1,12 @@
-import os
+import gzip
+import io
+import json
+import time
+from collections import Counter
+from itertools import chain
 from pathlib import Path
 from datetime import date
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Sequence, Tuple
 
 import streamlit as st
 
@@ -13,6 +18,8 @@ from journal.multi_repo_git_utils import (
     get_all_commits_across_repos_structured,
 )
 from journal.date_utils import resolve_since_date
+from journal.summarize import PROMPT_VERSION, CACHE_STATS as SUMMARY_CACHE_STATS
+from core.config import get_config
 
 
 # ---------------------------
@@ -27,12 +34,41 @@ if "last_data" not in st.session_state:
     st.session_state.last_data = None
 
 
+# ---------------------------
+# Cache telemetry
+# ---------------------------
+def _cache_stats() -> Counter:
+    return st.session_state.setdefault("_cache_stats", Counter())
+
+
+def _record_miss(name: str) -> None:
+    # Called from inside st.cache_data bodies, which only run on a miss
+    _cache_stats()[f"{name} miss"] += 1
+
+
+def _cached_call(name: str, fn, *args):
+    stats = _cache_stats()
+    misses_before = stats[f"{name} miss"]
+    result = fn(*args)
+    if stats[f"{name} miss"] == misses_before:
+        stats[f"{name} hit"] += 1
+    return result
+
+
+@st.cache_data(show_spinner=False)
+def _find_repos_cached(root_str: str, mtime_ns: int) -> List[str]:
+    # mtime_ns is only part of the cache key: adding/removing a repo under
+    # root bumps it and forces a fresh walk
+    _record_miss("repo list")
+    return [str(p) for p in find_git_repos(Path(root_str))]
+
+
 # ---------------------------
 # Sidebar controls
 # ---------------------------
 st.sidebar.header("Controls")
 
-root_default = os.path.expanduser("~/dev")
+root_default = str(Path("~/dev").expanduser())
 root = st.sidebar.text_input("Root folder", root_default)
 
 mode = st.sidebar.selectbox("Mode", ["today", "weekly", "monthly", "custom"])
@@ -53,74 +89,150 @@ summarize = st.sidebar.checkbox("Summarize with LLM", value=True)
 # Repo picker if not scanning all
 selected_repos: Optional[List[Path]] = None
 if not all_projects:
-    repos = find_git_repos(Path(os.path.expanduser(root)))
-    repo_choices = [str(p) for p in repos]
+    root_path = Path(root).expanduser()
+    try:
+        root_mtime = root_path.stat().st_mtime_ns
+    except OSError:
+        root_mtime = 0
+    repo_choices = _cached_call("repo list", _find_repos_cached, str(root_path), root_mtime)
     picked = st.sidebar.multiselect("Select repositories", repo_choices, default=repo_choices)
     selected_repos = [Path(p) for p in picked]
 
 st.sidebar.markdown("---")
 export_md = st.sidebar.checkbox("Prepare Markdown export")
 run = st.sidebar.button("Run")
+clear_cache = st.sidebar.button("Clear cache")
+
+# Effective scan arguments; doubles as the cache key for both the in-memory
+# and the on-disk last-scan cache
+scan_key = (
+    str(Path(root).expanduser()),
+    since_iso,
+    to_iso,
+    summarize,
+    mode,
+    tuple(str(p) for p in selected_repos) if selected_repos is not None else None,
+)
 
 
 # ---------------------------
 # Helpers
 # ---------------------------
-def _collect_export_lines(data: Dict[str, Any]) -> List[str]:
-    lines: List[str] = []
-    for r in data.get("repos", []):
-        lines.append(f"### 📁 {r['repo_name']}")
-        for b in r.get("bullets", []):
-            lines.append(b)
-        if r.get("standup_summary"):
-            lines.append(f"\n**Standup Summary:** {r['standup_summary']}\n")
-    team_para = data.get("team_summary") or ""
+@st.cache_data(show_spinner=False, ttl=3600)
+def _scan(
+    root: str,
+    since_iso: str,
+    to_iso: Optional[str],
+    summarize: bool,
+    mode: str,
+    selected_repos: Optional[Tuple[str, ...]],
+) -> Dict[str, Any]:
+    # Cached on the effective arguments so identical reruns skip git + LLM work
+    _record_miss("scan")
+    return get_all_commits_across_repos_structured(
+        since_date=since_iso,
+        to_date=to_iso,
+        root=root,
+        summarize_with_llm=summarize,
+        mode=mode,
+        selected_repos=[Path(p) for p in selected_repos] if selected_repos is not None else None,
+    )
+
+
+def _last_scan_path() -> Path:
+    return get_config().get_cache_path().parent / "last_scan.json.gz"
+
+
+def _persist_last(data: Dict[str, Any], key: tuple) -> None:
+    envelope = {
+        "key": list(key),
+        "scan_ts": time.time(),
+        "prompt_version": PROMPT_VERSION,
+        "data": data,
+    }
+    try:
+        _last_scan_path().write_bytes(gzip.compress(json.dumps(envelope, ensure_ascii=False).encode("utf-8")))
+    except OSError:
+        pass  # best effort; losing the warm-start copy is harmless
+
+
+def _load_last_if_key_matches(key: tuple) -> Optional[Dict[str, Any]]:
+    try:
+        envelope = json.loads(gzip.decompress(_last_scan_path().read_bytes()))
+    except (OSError, ValueError):
+        return None
+    # JSON round-trip the key so tuples compare equal to stored lists
+    if envelope.get("key") != json.loads(json.dumps(list(key))):
+        return None
+    if envelope.get("prompt_version") != PROMPT_VERSION:
+        return None
+    return envelope.get("data")
+
+
+def _repo_section(r: Dict[str, Any]) -> str:
+    parts = [f"### 📁 {r['repo_name']}"]
+    parts.extend(r.get("bullets") or ())
+    standup = r.get("standup_summary")
+    if standup:
+        parts.append(f"\n**Standup Summary:** {standup}\n")
+    return "\n\n".join(parts)
+
+
+def _export_sections(repos: Sequence[Dict[str, Any]], team_para: str) -> Iterator[str]:
+    for r in repos:
+        yield _repo_section(r)
     if team_para:
-        lines.append("### 🧠 Scrum Summary")
-        lines.append(team_para)
-    return lines
+        yield f"### 🧠 Scrum Summary\n\n{team_para}"
+
 
+def _export_chunks(repos: Sequence[Dict[str, Any]], team_para: str) -> Iterator[bytes]:
+    # Pre-encoded fragments, blank-line separated, so the report is never
+    # held as a list *and* a joined string at the same time
+    sep = b""
+    for section in _export_sections(repos, team_para):
+        yield sep
+        yield section.encode("utf-8")
+        sep = b"\n\n"
 
-def _repos_table(data: Dict[str, Any]) -> pd.DataFrame:
-    rows = []
-    for r in data.get("repos", []):
-        n_commits = len(r.get("bullets") or [])
-        rows.append({"repo": r["repo_name"], "commits": n_commits})
-    return pd.DataFrame(rows).sort_values("commits", ascending=False)
 
+@st.cache_data(show_spinner=False)
+def _repos_table(repos: Sequence[Dict[str, Any]]) -> pd.DataFrame:
+    _record_miss("repos table")
+    df = pd.DataFrame({
+        "repo": [r["repo_name"] for r in repos],
+        "commits": [len(r.get("bullets") or ()) for r in repos],
+    })
+    return df.sort_values("commits", ascending=False, kind="stable")
 
-def _worktype_table(data: Dict[str, Any]) -> Optional[pd.DataFrame]:
+
+@st.cache_data(show_spinner=False)
+def _worktype_table(repos: Sequence[Dict[str, Any]]) -> Optional[pd.DataFrame]:
     # If your summarize pipeline exposes work types, you can attach them in the structured output
     # as r["work_types"] = ["feature","refactor",...]. If absent, we skip.
-    buckets = {}
-    has_any = False
-    for r in data.get("repos", []):
-        wtypes = r.get("work_types")  # Optional extension from your summarize.py
-        if not wtypes:
-            continue
-        has_any = True
-        for w in wtypes:
-            buckets[w] = buckets.get(w, 0) + 1
-    if not has_any:
+    _record_miss("work type table")
+    buckets = Counter(chain.from_iterable(r.get("work_types") or () for r in repos))
+    if not buckets:
         return None
-    df = pd.DataFrame([{"work_type": k, "count": v} for k, v in buckets.items()])
-    return df.sort_values("count", ascending=False)
+    # most_common() is already sorted by count, descending
+    return pd.DataFrame(buckets.most_common(), columns=["work_type", "count"])
 
 
 # ---------------------------
 # Main action
 # ---------------------------
+if clear_cache:
+    _scan.clear()
+    st.sidebar.success("Cache cleared")
+
 if run:
     with st.spinner("Scanning repositories and summarizing…"):
-        data = get_all_commits_across_repos_structured(
-            since_date=since_iso,
-            to_date=to_iso,
-            root=root,
-            summarize_with_llm=summarize,
-            mode=mode,
-            selected_repos=selected_repos,
-        )
+        data = _cached_call("scan", _scan, *scan_key)
         st.session_state.last_data = data
+        _persist_last(data, scan_key)
+elif st.session_state.last_data is None and not st.session_state.get("last_data_restored"):
+    # Warm start: reuse the previous process's result for the same arguments
+    st.session_state.last_data_restored = True
+    st.session_state.last_data = _load_last_if_key_matches(scan_key)
 
 # ---------------------------
 # Render results
@@ -129,50 +241,63 @@ data = st.session_state.last_data
 if not data:
     st.info("Set your options in the sidebar, then click **Run**.")
 else:
-    repos = data.get("repos", [])
+    repos = data.get("repos") or ()
     if not repos:
         st.warning("No commits found in the selected period.")
     else:
-        # Top-level analytics
+        # Top-level analytics (st.expander bodies always execute, so gate on a
+        # checkbox to skip building the tables until they are asked for)
         st.subheader("📊 Overview")
-        colA, colB = st.columns([1, 1])
+        if st.checkbox("Show overview analytics", value=False):
+            colA, colB = st.columns([1, 1])
 
-        with colA:
-            df_repos = _repos_table(data)
-            st.markdown("**Commits per repository**")
-            st.bar_chart(df_repos.set_index("repo"))
+            with colA:
+                df_repos = _cached_call("repos table", _repos_table, repos)
+                st.markdown("**Commits per repository**")
+                st.bar_chart(df_repos.set_index("repo"))
 
-        with colB:
-            df_wt = _worktype_table(data)
-            if df_wt is not None and not df_wt.empty:
-                st.markdown("**Work types (if available)**")
-                st.bar_chart(df_wt.set_index("work_type"))
-            else:
-                st.caption("Work type chart will appear when your summarizer returns `work_types` per repo.")
+            with colB:
+                df_wt = _cached_call("work type table", _worktype_table, repos)
+                if df_wt is not None and not df_wt.empty:
+                    st.markdown("**Work types (if available)**")
+                    st.bar_chart(df_wt.set_index("work_type"))
+                else:
+                    st.caption("Work type chart will appear when your summarizer returns `work_types` per repo.")
 
         st.markdown("---")
 
         # Per-repo sections
         for r in repos:
             with st.expander(f"📁 {r['repo_name']}", expanded=True):
-                bullets = r.get("bullets") or []
+                # One markdown element per expander instead of one per field
+                parts = []
+                bullets = r.get("bullets") or ()
                 if bullets:
-                    st.markdown("**Commits**")
                     # Bullets are already Markdown-like, render natively
-                    st.markdown("\n".join(bullets))
-                if r.get("standup_summary"):
-                    st.markdown("**Standup Summary**")
-                    st.write(r["standup_summary"])
+                    parts.append("**Commits**\n\n" + "\n".join(bullets))
+                standup = r.get("standup_summary")
+                if standup:
+                    parts.append(f"**Standup Summary**\n\n{standup}")
+                if parts:
+                    st.markdown("\n\n".join(parts))
 
         # Team-level scrum summary
-        team_para = data.get("team_summary", "") or ""
+        team_para = data.get("team_summary") or ""
         if team_para:
             st.subheader("🧠 Scrum Summary")
             st.write(team_para)
 
         # Export
         if export_md:
-            export_lines = _collect_export_lines(data)
-            if export_lines:
-                md = "\n\n".join(export_lines).encode("utf-8")
+            buf = io.BytesIO()
+            buf.writelines(_export_chunks(repos, team_para))
+            md = buf.getvalue()
+            if md:
                 st.download_button("⬇️ Download Markdown", data=md, file_name="devdiary_summary.md", mime="text/markdown")
+
+# Cache stats (rendered last so this rerun's lookups are included)
+with st.sidebar.expander("Cache stats"):
+    for k, v in sorted(_cache_stats().items()):
+        st.caption(f"{k}: {v}")
+    for k, v in sorted(SUMMARY_CACHE_STATS.items()):
+        st.caption(f"summary {k}: {v}")
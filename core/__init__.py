@@ -21,6 +21,7 @@ from .types import (
     CommitSummary,
     RepositorySummary,
     ScanResult,
+    ScanAggregate,
     ScanProgress,
     ExportOptions,
 )
@@ -38,6 +39,11 @@ from .config import (
     reset_config,
 )
 
+# Persistent summary cache
+from .cache import (
+    SummaryCache,
+)
+
 # Repository scanner
 from .scanner import (
     RepositoryScanner,
@@ -63,6 +69,7 @@ __all__ = [
     "CommitSummary",
     "RepositorySummary",
     "ScanResult",
+    "ScanAggregate",
     "ScanProgress",
     "ExportOptions",
     # Config
@@ -75,6 +82,8 @@ __all__ = [
     "get_config",
     "reload_config",
     "reset_config",
+    # Cache
+    "SummaryCache",
     # Scanner
     "RepositoryScanner",
     # Summarizer
@@ -0,0 +1,202 @@
+"""
+Persistent summary cache for DevDiary.
+
+Stores per-commit LLM summaries in a SQLite database so repeat scans over
+overlapping date windows skip LLM calls for commits already summarized.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, List
+
+try:
+    import orjson  # optional, much faster JSON (de)serialization
+except ImportError:
+    orjson = None
+
+from core.config import DevDiaryConfig, get_config
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    cached_at REAL NOT NULL
+)
+"""
+
+
+def _encode(value: Dict[str, Any]) -> str:
+    """Serialize a summary dict for the ``value`` column."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _decode(raw: str) -> Dict[str, Any]:
+    """Parse a ``value`` column; raises ValueError on corrupt data."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class SummaryCache:
+    """
+    SQLite-backed cache for per-commit LLM summaries.
+
+    Entries are keyed by a hash of (repo, commit hash, model, prompt version),
+    so changing the model or bumping the prompt version invalidates old entries
+    automatically. Entries older than ``max_age_days`` are evicted on open.
+    """
+
+    def __init__(self, config: Optional[DevDiaryConfig] = None, path: Optional[Path] = None):
+        """
+        Open (or create) the summary cache.
+
+        Args:
+            config: Configuration instance. If None, uses global config.
+            path: Explicit database path. If None, uses config cache path.
+        """
+        self.config = config if config is not None else get_config()
+        self.path = path if path is not None else self.config.get_cache_path()
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._evict_expired()
+        logger.debug(f"SummaryCache opened at: {self.path}")
+
+    @staticmethod
+    def make_key(repo_name: str, commit_hash: str, model: str, prompt_version: str) -> str:
+        """
+        Build the cache key for a commit summary.
+
+        Args:
+            repo_name: Name of the repository
+            commit_hash: Git commit hash
+            model: LLM model name
+            prompt_version: Version of the summarization prompt
+
+        Returns:
+            Hex digest identifying the cache entry
+        """
+        raw = f"{repo_name}|{commit_hash}|{model}|{prompt_version}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached summary.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached summary dict, or None on miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        try:
+            return _decode(row[0])
+        except ValueError:
+            logger.warning(f"Discarding corrupted cache entry: {key}")
+            return None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a summary in the cache.
+
+        Args:
+            key: Cache key from make_key()
+            value: JSON-serializable summary dict
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, value, cached_at) VALUES (?, ?, ?)",
+                (key, _encode(value), time.time()),
+            )
+            self._conn.commit()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up several cached summaries with one query per chunk of keys.
+
+        Args:
+            keys: Cache keys from make_key()
+
+        Returns:
+            Dict mapping each hit key to its summary; misses are absent
+        """
+        keys = list(keys)
+        rows: List[tuple] = []
+        with self._lock:
+            # Stay under SQLite's host-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(self._conn.execute(
+                    f"SELECT key, value FROM summaries WHERE key IN ({placeholders})", chunk
+                ))
+
+        found: Dict[str, Dict[str, Any]] = {}
+        for key, value in rows:
+            try:
+                found[key] = _decode(value)
+            except ValueError:
+                logger.warning(f"Discarding corrupted cache entry: {key}")
+        return found
+
+    def put_many(self, items: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Store several summaries in a single transaction.
+
+        Args:
+            items: Mapping of cache key to JSON-serializable summary dict
+        """
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO summaries (key, value, cached_at) VALUES (?, ?, ?)",
+                [(k, _encode(v), now) for k, v in items.items()],
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._conn.execute("DELETE FROM summaries")
+            self._conn.commit()
+        logger.info("SummaryCache cleared")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _evict_expired(self) -> None:
+        """Delete entries older than the configured max_age_days."""
+        cutoff = time.time() - self.config.cache.max_age_days * 86400
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM summaries WHERE cached_at < ?", (cutoff,)
+            )
+            self._conn.commit()
+
+        if cursor.rowcount:
+            logger.info(f"Evicted {cursor.rowcount} expired cache entries")
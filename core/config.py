@@ -7,11 +7,14 @@ automatic config file discovery, and sensible defaults.
 
 from __future__ import annotations
 
+import copy
 import logging
 import os
-from dataclasses import dataclass, field, asdict
+import re
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 
 try:
     import yaml
@@ -34,7 +37,32 @@ DEFAULT_EXCLUDED_PATTERNS = [
 ]
 
 
-@dataclass
+@lru_cache(maxsize=8)
+def _compile_excluded(patterns: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile substring exclusion patterns into one alternation regex."""
+    if not patterns:
+        return None
+    return re.compile("|".join(re.escape(p) for p in patterns))
+
+
+@lru_cache(maxsize=32)
+def _expand_path(path: str) -> Path:
+    """Expand ~ in a path string; memoized since the result never changes in-process."""
+    return Path(path).expanduser()
+
+
+# Environment variable -> (config section, field) overrides
+_ENV_OVERRIDES = (
+    ("DEVDIARY_ROOT", "scanning", "root_path"),
+    ("DEVDIARY_MODEL", "ollama", "model"),
+    ("DEVDIARY_OLLAMA_ENDPOINT", "ollama", "endpoint"),
+)
+
+# Parsed YAML keyed by (path, mtime_ns) so unchanged files are not re-parsed
+_yaml_cache: Dict[Tuple[str, int], dict] = {}
+
+
+@dataclass(slots=True)
 class OllamaConfig:
     """
     Configuration for Ollama LLM integration.
@@ -44,14 +72,18 @@ class OllamaConfig:
         model: Model name to use (e.g., "llama3")
         endpoint: Ollama server endpoint URL
         timeout: Request timeout in seconds
+        max_concurrent: Maximum number of in-flight LLM requests
+        batch_size: Commits classified per LLM request (1 = one request per commit)
     """
     enabled: bool = True
     model: str = "llama3"
     endpoint: str = "http://localhost:11434"
     timeout: int = 120
+    max_concurrent: int = 4
+    batch_size: int = 8
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanningConfig:
     """
     Configuration for repository scanning behavior.
@@ -60,15 +92,36 @@ class ScanningConfig:
         root_path: Root directory to scan for Git repositories
         excluded_patterns: Patterns to exclude from file analysis
         max_repos: Maximum number of repositories to scan (None = unlimited)
+        max_workers: Number of threads used to scan repositories in parallel
         include_hidden: Whether to include hidden directories (starting with .)
     """
     root_path: str = "~/dev"
     excluded_patterns: List[str] = field(default_factory=lambda: DEFAULT_EXCLUDED_PATTERNS.copy())
     max_repos: Optional[int] = None
+    max_workers: int = 8
     include_hidden: bool = False
 
+    def is_excluded(self, path: str) -> bool:
+        """
+        Check whether a file path matches any excluded pattern.
+
+        All patterns are matched in a single regex pass; the compiled regex
+        is cached per pattern list so edits to excluded_patterns take effect.
+
+        Args:
+            path: File path as reported by git
+
+        Returns:
+            True if the path should be ignored
+        """
+        compiled = _compile_excluded(tuple(self.excluded_patterns))
+        if compiled is None:
+            return False
+        normalized = path.strip().replace("\\", "/").lower()
+        return compiled.search(normalized) is not None
+
 
-@dataclass
+@dataclass(slots=True)
 class CacheConfig:
     """
     Configuration for commit summary caching.
@@ -83,7 +136,7 @@ class CacheConfig:
     max_age_days: int = 30
 
 
-@dataclass
+@dataclass(slots=True)
 class UIConfig:
     """
     Configuration for user interface preferences.
@@ -102,7 +155,7 @@ class UIConfig:
     page_layout: str = "wide"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportConfig:
     """
     Configuration for exporting summaries.
@@ -117,7 +170,7 @@ class ExportConfig:
     filename_pattern: str = "devdiary_{mode}_{date}"
 
 
-@dataclass
+@dataclass(slots=True)
 class DevDiaryConfig:
     """
     Complete DevDiary configuration.
@@ -159,15 +212,15 @@ class DevDiaryConfig:
 
         # Otherwise, search for config file
         found_config = cls._find_config_file()
-        if found_config:
+        if found_config and found_config.is_file():
             logger.info(f"Found configuration file: {found_config}")
             return cls._load_from_file(found_config)
 
         logger.info("No configuration file found, using defaults")
         return cls()
 
-    @classmethod
-    def _find_config_file(cls) -> Optional[Path]:
+    @staticmethod
+    def _find_config_file() -> Optional[Path]:
         """
         Search for configuration file in default locations.
 
@@ -207,10 +260,19 @@ class DevDiaryConfig:
             DevDiaryConfig instance populated from file
         """
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f) or {}
-
-            logger.debug(f"Loaded configuration data: {data}")
+            cache_key = (str(config_path), config_path.stat().st_mtime_ns)
+            cached = _yaml_cache.get(cache_key)
+            if cached is None:
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    cached = yaml.safe_load(f) or {}
+                _yaml_cache.clear()
+                _yaml_cache[cache_key] = cached
+                logger.debug(f"Loaded configuration data: {cached}")
+            else:
+                logger.debug(f"Reusing parsed configuration for: {config_path}")
+
+            # Work on a copy so env overrides never leak into the cache
+            data = copy.deepcopy(cached)
 
             # Apply environment variable overrides
             data = cls._apply_env_overrides(data)
@@ -234,6 +296,11 @@ class DevDiaryConfig:
             logger.error(f"Invalid configuration structure: {e}")
             raise ValueError(f"Configuration has invalid fields: {e}") from e
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop memoized parsed YAML."""
+        _yaml_cache.clear()
+
     @classmethod
     def _apply_env_overrides(cls, data: dict) -> dict:
         """
@@ -250,24 +317,13 @@ class DevDiaryConfig:
         Returns:
             Modified configuration dictionary with env var overrides
         """
-        # Ensure nested dicts exist
-        if 'scanning' not in data:
-            data['scanning'] = {}
-        if 'ollama' not in data:
-            data['ollama'] = {}
-
-        # Apply overrides
-        if 'DEVDIARY_ROOT' in os.environ:
-            data['scanning']['root_path'] = os.environ['DEVDIARY_ROOT']
-            logger.debug(f"Applied DEVDIARY_ROOT override: {os.environ['DEVDIARY_ROOT']}")
-
-        if 'DEVDIARY_MODEL' in os.environ:
-            data['ollama']['model'] = os.environ['DEVDIARY_MODEL']
-            logger.debug(f"Applied DEVDIARY_MODEL override: {os.environ['DEVDIARY_MODEL']}")
-
-        if 'DEVDIARY_OLLAMA_ENDPOINT' in os.environ:
-            data['ollama']['endpoint'] = os.environ['DEVDIARY_OLLAMA_ENDPOINT']
-            logger.debug(f"Applied DEVDIARY_OLLAMA_ENDPOINT override: {os.environ['DEVDIARY_OLLAMA_ENDPOINT']}")
+        env = os.environ
+        for var, section, key in _ENV_OVERRIDES:
+            value = env.get(var)
+            if value is not None:
+                data.setdefault(section, {})[key] = value
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Applied {var} override: {value}")
 
         return data
 
@@ -292,7 +348,7 @@ class DevDiaryConfig:
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Convert to dict and save
-        data = asdict(self)
+        data = self.to_dict()
 
         try:
             with open(config_path, 'w', encoding='utf-8') as f:
@@ -304,6 +360,25 @@ class DevDiaryConfig:
             logger.error(f"Failed to save configuration: {e}", exc_info=True)
             raise
 
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Convert configuration to a plain nested dict for serialization.
+
+        Unlike dataclasses.asdict this is a shallow copy: section values
+        (e.g. excluded_patterns) are shared with the live config, which is
+        fine for read-only consumers such as yaml.safe_dump.
+
+        Returns:
+            Dictionary mapping section name to its field values
+        """
+        return {
+            section.name: {
+                f.name: getattr(getattr(self, section.name), f.name)
+                for f in fields(getattr(self, section.name))
+            }
+            for section in fields(self)
+        }
+
     def get_expanded_root_path(self) -> Path:
         """
         Get the scanning root path with ~ expansion.
@@ -311,7 +386,7 @@ class DevDiaryConfig:
         Returns:
             Fully expanded Path object
         """
-        return Path(os.path.expanduser(self.scanning.root_path))
+        return _expand_path(self.scanning.root_path)
 
     def get_cache_path(self) -> Path:
         """
@@ -321,7 +396,7 @@ class DevDiaryConfig:
             Path to cache file
         """
         if self.cache.path:
-            return Path(os.path.expanduser(self.cache.path))
+            return _expand_path(self.cache.path)
 
         # Default cache location (platform-aware)
         import sys
@@ -333,7 +408,7 @@ class DevDiaryConfig:
             cache_dir = Path.home() / ".cache" / "devdiary"
 
         cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir / "commit_cache.json"
+        return cache_dir / "commit_cache.db"
 
     def get_export_directory(self) -> Path:
         """
@@ -342,7 +417,7 @@ class DevDiaryConfig:
         Returns:
             Fully expanded Path object
         """
-        export_dir = Path(os.path.expanduser(self.export.output_directory))
+        export_dir = _expand_path(self.export.output_directory)
         export_dir.mkdir(parents=True, exist_ok=True)
         return export_dir
 
@@ -380,6 +455,7 @@ def reload_config(config_path: Optional[Path] = None) -> DevDiaryConfig:
     global _global_config
 
     logger.info("Reloading configuration")
+    # Parsed YAML stays cached and is invalidated by mtime
     _global_config = DevDiaryConfig.load(config_path)
 
     return _global_config
@@ -395,6 +471,7 @@ def reset_config() -> DevDiaryConfig:
     global _global_config
 
     logger.info("Resetting configuration to defaults")
+    DevDiaryConfig.clear_cache()
     _global_config = DevDiaryConfig()
 
     return _global_config
@@ -7,17 +7,287 @@ Markdown, HTML, JSON, and PDF with customizable options.
 
 from __future__ import annotations
 
+import io
 import json
 import logging
+import re
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
+
+try:
+    import orjson  # optional, much faster JSON encoding
+except ImportError:
+    orjson = None
 
 from core.types import ScanResult, ExportOptions
 from core.config import DevDiaryConfig, get_config
 
 logger = logging.getLogger(__name__)
 
+# Inline Markdown patterns, compiled once
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_CODE_RE = re.compile(r"`([^`]+)`")
+
+# Single-pass HTML escaping (same entities as html.escape with quote=True)
+_HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+# Static HTML export template. The stylesheet is a plain constant (no format
+# escaping) substituted into the document via str.format.
+_HTML_STYLE = """    <style>
+        :root {
+            --bg-color: #ffffff;
+            --text-color: #24292e;
+            --border-color: #e1e4e8;
+            --code-bg: #f6f8fa;
+            --link-color: #0366d6;
+            --header-bg: #f6f8fa;
+        }
+
+        @media (prefers-color-scheme: dark) {
+            :root {
+                --bg-color: #0d1117;
+                --text-color: #c9d1d9;
+                --border-color: #30363d;
+                --code-bg: #161b22;
+                --link-color: #58a6ff;
+                --header-bg: #161b22;
+            }
+        }
+
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Noto Sans', Helvetica, Arial, sans-serif;
+            line-height: 1.6;
+            color: var(--text-color);
+            background-color: var(--bg-color);
+            max-width: 900px;
+            margin: 0 auto;
+            padding: 20px;
+        }
+
+        h1, h2, h3 {
+            margin-top: 24px;
+            margin-bottom: 16px;
+            font-weight: 600;
+            line-height: 1.25;
+        }
+
+        h1 { font-size: 2em; border-bottom: 1px solid var(--border-color); padding-bottom: 0.3em; }
+        h2 { font-size: 1.5em; border-bottom: 1px solid var(--border-color); padding-bottom: 0.3em; }
+        h3 { font-size: 1.25em; }
+
+        code {
+            padding: 0.2em 0.4em;
+            margin: 0;
+            font-size: 85%;
+            background-color: var(--code-bg);
+            border-radius: 3px;
+            font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
+        }
+
+        pre {
+            padding: 16px;
+            overflow: auto;
+            font-size: 85%;
+            line-height: 1.45;
+            background-color: var(--code-bg);
+            border-radius: 6px;
+        }
+
+        ul, ol {
+            padding-left: 2em;
+        }
+
+        li {
+            margin-top: 0.25em;
+        }
+
+        strong {
+            font-weight: 600;
+        }
+
+        hr {
+            height: 0.25em;
+            padding: 0;
+            margin: 24px 0;
+            background-color: var(--border-color);
+            border: 0;
+        }
+
+        details {
+            margin-top: 16px;
+            padding: 16px;
+            background-color: var(--header-bg);
+            border-radius: 6px;
+        }
+
+        summary {
+            cursor: pointer;
+            font-weight: 600;
+        }
+
+        .header-info {
+            background-color: var(--header-bg);
+            padding: 16px;
+            border-radius: 6px;
+            margin-bottom: 24px;
+        }
+    </style>"""
+
+_HTML_DOC = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>DevDiary Summary - {title}</title>
+{style}
+</head>
+<body>
+{body}
+</body>
+</html>"""
+
+
+class _FilenameFields(dict):
+    """
+    format_map() fields for export filenames.
+
+    {date} and {time} are only formatted if the pattern uses them, and
+    unknown placeholders are left in the filename untouched.
+    """
+
+    def __init__(self, mode: str, now: datetime):
+        super().__init__(mode=mode)
+        self._now = now
+
+    def __missing__(self, key: str) -> str:
+        if key == "date":
+            return self._now.strftime("%Y-%m-%d")
+        if key == "time":
+            return self._now.strftime("%H%M%S")
+        return f"{{{key}}}"
+
+
+class _MarkdownSink:
+    """Render sink for the export walk that emits Markdown lines."""
+
+    def __init__(self):
+        # One growable buffer instead of a list of small strings plus a join
+        self._buf = io.StringIO()
+        self._write = self._buf.write
+
+    def heading(self, level: int, text: str) -> None:
+        self._write(f"{'#' * level} {text}\n")
+
+    def text(self, text: str) -> None:
+        self._write(f"{text}\n")
+
+    def item(self, text: str, level: int = 0) -> None:
+        self._write(f"{'  ' * level}- {text}\n")
+
+    def bullet(self, bullet: str) -> None:
+        # Pre-formatted Markdown bullet from the summarizer
+        self._write(f"{bullet}\n")
+
+    def blank(self) -> None:
+        self._write("\n")
+
+    def rule(self) -> None:
+        self._write("---\n")
+
+    def open_details(self, summary: str) -> None:
+        self._write(f"<details>\n<summary>{summary}</summary>\n")
+
+    def close_details(self) -> None:
+        self._write("</details>\n")
+
+    def getvalue(self) -> str:
+        # Lines are newline-terminated; drop the final terminator in place
+        end = self._buf.tell()
+        if end:
+            self._buf.seek(end - 1)
+            self._buf.truncate()
+        return self._buf.getvalue()
+
+
+class _HtmlSink:
+    """Render sink for the export walk that emits escaped HTML directly."""
+
+    def __init__(self):
+        self._buf = io.StringIO()
+        self._write = self._buf.write
+        self._in_paragraph = False
+        self._list_depth = 0
+
+    def _inline(self, text: str) -> str:
+        escaped = text.translate(_HTML_ESCAPE_TABLE)
+        return _CODE_RE.sub(r"<code>\1</code>", _BOLD_RE.sub(r"<strong>\1</strong>", escaped))
+
+    def _close_blocks(self) -> None:
+        if self._in_paragraph:
+            self._write("</p>\n")
+            self._in_paragraph = False
+        while self._list_depth:
+            self._write("</li></ul>" if self._list_depth > 1 else "</li>\n</ul>\n")
+            self._list_depth -= 1
+
+    def heading(self, level: int, text: str) -> None:
+        self._close_blocks()
+        self._write(f"<h{level}>{self._inline(text)}</h{level}>\n")
+
+    def text(self, text: str) -> None:
+        if self._list_depth:
+            self._close_blocks()
+        if not self._in_paragraph:
+            self._write("<p>")
+            self._in_paragraph = True
+        else:
+            self._write("\n")
+        self._write(self._inline(text))
+
+    def item(self, text: str, level: int = 0) -> None:
+        if self._in_paragraph:
+            self._close_blocks()
+        depth = level + 1
+        while self._list_depth > depth:
+            self._write("</li></ul>")
+            self._list_depth -= 1
+        if self._list_depth == depth:
+            self._write("</li>\n")
+        while self._list_depth < depth:
+            self._write("<ul>\n")
+            self._list_depth += 1
+        self._write(f"<li>{self._inline(text)}")
+
+    def bullet(self, bullet: str) -> None:
+        self.item(bullet[2:] if bullet.startswith("- ") else bullet)
+
+    def blank(self) -> None:
+        self._close_blocks()
+
+    def rule(self) -> None:
+        self._close_blocks()
+        self._write("<hr>\n")
+
+    def open_details(self, summary: str) -> None:
+        self._close_blocks()
+        self._write(f"<details>\n<summary>{summary.translate(_HTML_ESCAPE_TABLE)}</summary>\n")
+
+    def close_details(self) -> None:
+        self._close_blocks()
+        self._write("</details>\n")
+
+    def getvalue(self) -> str:
+        self._close_blocks()
+        return self._buf.getvalue().rstrip("\n")
+
 
 class Exporter:
     """
@@ -36,7 +306,7 @@ class Exporter:
         """
         self.config = config if config is not None else get_config()
         logger.info("Exporter initialized")
-        logger.debug(f"Default export format: {self.config.export.default_format}")
+        logger.debug("Default export format: %s", self.config.export.default_format)
 
     def export(
         self,
@@ -86,92 +356,105 @@ class Exporter:
             Markdown-formatted string
         """
         logger.debug("Generating Markdown export")
-        lines: list[str] = []
+        markdown = self._walk(scan_result, options, _MarkdownSink())
+        logger.debug("Generated Markdown export (%s chars)", len(markdown))
+        return markdown
+
+    def _walk(self, scan_result: ScanResult, options: ExportOptions, sink) -> str:
+        """
+        Walk the report structure once, emitting it into a render sink.
+
+        Args:
+            scan_result: ScanResult to export
+            options: Export options
+            sink: _MarkdownSink or _HtmlSink receiving the document
 
+        Returns:
+            Rendered document from the sink
+        """
         # Header
-        lines.append("# DevDiary Summary")
-        lines.append("")
-        lines.append(f"**Mode:** {scan_result.scan_mode.value}")
-        lines.append(f"**Period:** {scan_result.since_date} to {scan_result.to_date or 'now'}")
-        lines.append(f"**Generated:** {scan_result.scan_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        sink.heading(1, "DevDiary Summary")
+        sink.blank()
+        sink.text(f"**Mode:** {scan_result.scan_mode.value}")
+        sink.text(f"**Period:** {scan_result.since_date} to {scan_result.to_date or 'now'}")
+        sink.text(f"**Generated:** {scan_result.scan_time.strftime('%Y-%m-%d %H:%M:%S')}")
 
         # Overall statistics
         if options.include_stats:
-            lines.append("")
-            lines.append("## Overview")
-            lines.append("")
-            lines.append(f"- **Total Repositories:** {scan_result.total_repos}")
-            lines.append(f"- **Total Commits:** {scan_result.total_commits}")
-            lines.append(f"- **Active Repositories:** {len(scan_result.get_repos_with_activity())}")
+            sink.blank()
+            sink.heading(2, "Overview")
+            sink.blank()
+            stats = scan_result.aggregate()
+            sink.item(f"**Total Repositories:** {stats.total_repos}")
+            sink.item(f"**Total Commits:** {stats.total_commits}")
+            sink.item(f"**Active Repositories:** {stats.active_repos}")
 
             # Work type distribution
-            work_types = scan_result.work_type_distribution
+            work_types = stats.work_type_distribution
             if work_types:
-                lines.append("")
-                lines.append("### Work Type Distribution")
-                lines.append("")
+                sink.blank()
+                sink.heading(3, "Work Type Distribution")
+                sink.blank()
                 for work_type, count in sorted(work_types.items(), key=lambda x: x[1], reverse=True):
-                    lines.append(f"- **{work_type.value.capitalize()}:** {count}")
+                    sink.item(f"**{work_type.value.capitalize()}:** {count}")
 
         # Per-repository sections
-        lines.append("")
-        lines.append("## Repositories")
-        lines.append("")
+        sink.blank()
+        sink.heading(2, "Repositories")
+        sink.blank()
 
         for repo in scan_result.repositories:
-            lines.append(f"### 📁 {repo.repo_name}")
-            lines.append("")
+            sink.heading(3, f"📁 {repo.repo_name}")
+            sink.blank()
 
             # Repository statistics
             if options.include_stats:
-                lines.append(f"**Commits:** {repo.commit_count} | "
-                           f"**Files:** {repo.total_files_changed} | "
-                           f"**+{repo.total_insertions}** / **-{repo.total_deletions}**")
-                lines.append("")
+                sink.text(f"**Commits:** {repo.commit_count} | "
+                          f"**Files:** {repo.total_files_changed} | "
+                          f"**+{repo.total_insertions}** / **-{repo.total_deletions}**")
+                sink.blank()
 
             # Commit bullets
             if options.include_bullets and repo.bullets:
-                lines.append("**Commits:**")
-                lines.append("")
+                sink.text("**Commits:**")
+                sink.blank()
                 for bullet in repo.bullets:
-                    lines.append(bullet)
-                lines.append("")
+                    sink.bullet(bullet)
+                sink.blank()
 
             # Standup summary
             if options.include_standup and repo.standup_summary:
-                lines.append("**Standup Summary:**")
-                lines.append("")
-                lines.append(repo.standup_summary)
-                lines.append("")
+                sink.text("**Standup Summary:**")
+                sink.blank()
+                sink.text(repo.standup_summary)
+                sink.blank()
 
             # Diff details
             if options.include_diffs and repo.commits:
-                lines.append("<details>")
-                lines.append("<summary>Commit Details</summary>")
-                lines.append("")
+                sink.open_details("Commit Details")
+                sink.blank()
                 for commit in repo.commits:
-                    lines.append(f"- `{commit.commit_hash}`: {commit.message}")
+                    sink.item(f"`{commit.commit_hash}`: {commit.message}")
                     if commit.files_changed > 0:
-                        lines.append(f"  - Files: {commit.files_changed}, "
-                                   f"+{commit.insertions}, -{commit.deletions}")
-                lines.append("")
-                lines.append("</details>")
-                lines.append("")
+                        sink.item(f"Files: {commit.files_changed}, "
+                                  f"+{commit.insertions}, -{commit.deletions}", level=1)
+                sink.blank()
+                sink.close_details()
+                sink.blank()
 
         # Team summary
         if options.include_team_summary and scan_result.team_summary:
-            lines.append("## 🧠 Team Summary")
-            lines.append("")
-            lines.append(scan_result.team_summary)
-            lines.append("")
+            sink.heading(2, "🧠 Team Summary")
+            sink.blank()
+            sink.text(scan_result.team_summary)
+            sink.blank()
 
         # Footer
-        lines.append("---")
-        lines.append("")
-        lines.append("*Generated with DevDiary*")
+        sink.rule()
+        sink.blank()
+        sink.text("*Generated with DevDiary*")
 
-        logger.debug(f"Generated Markdown export ({len(lines)} lines)")
-        return "\n".join(lines)
+        return sink.getvalue()
 
     def to_html(self, scan_result: ScanResult, options: ExportOptions) -> str:
         """
@@ -186,192 +469,77 @@ class Exporter:
         """
         logger.debug("Generating HTML export")
 
-        # Convert markdown to HTML (simple conversion)
-        markdown_content = self.to_markdown(scan_result, options)
-
-        # Simple markdown to HTML conversion
-        html_body = self._markdown_to_html(markdown_content)
+        # Render the body straight from the scan result (no Markdown round-trip)
+        html_body = self._walk(scan_result, options, _HtmlSink())
 
         # Wrap in HTML template
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>DevDiary Summary - {scan_result.scan_mode.value}</title>
-    <style>
-        :root {{
-            --bg-color: #ffffff;
-            --text-color: #24292e;
-            --border-color: #e1e4e8;
-            --code-bg: #f6f8fa;
-            --link-color: #0366d6;
-            --header-bg: #f6f8fa;
-        }}
-
-        @media (prefers-color-scheme: dark) {{
-            :root {{
-                --bg-color: #0d1117;
-                --text-color: #c9d1d9;
-                --border-color: #30363d;
-                --code-bg: #161b22;
-                --link-color: #58a6ff;
-                --header-bg: #161b22;
-            }}
-        }}
-
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Noto Sans', Helvetica, Arial, sans-serif;
-            line-height: 1.6;
-            color: var(--text-color);
-            background-color: var(--bg-color);
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-
-        h1, h2, h3 {{
-            margin-top: 24px;
-            margin-bottom: 16px;
-            font-weight: 600;
-            line-height: 1.25;
-        }}
-
-        h1 {{ font-size: 2em; border-bottom: 1px solid var(--border-color); padding-bottom: 0.3em; }}
-        h2 {{ font-size: 1.5em; border-bottom: 1px solid var(--border-color); padding-bottom: 0.3em; }}
-        h3 {{ font-size: 1.25em; }}
-
-        code {{
-            padding: 0.2em 0.4em;
-            margin: 0;
-            font-size: 85%;
-            background-color: var(--code-bg);
-            border-radius: 3px;
-            font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
-        }}
-
-        pre {{
-            padding: 16px;
-            overflow: auto;
-            font-size: 85%;
-            line-height: 1.45;
-            background-color: var(--code-bg);
-            border-radius: 6px;
-        }}
-
-        ul, ol {{
-            padding-left: 2em;
-        }}
-
-        li {{
-            margin-top: 0.25em;
-        }}
-
-        strong {{
-            font-weight: 600;
-        }}
-
-        hr {{
-            height: 0.25em;
-            padding: 0;
-            margin: 24px 0;
-            background-color: var(--border-color);
-            border: 0;
-        }}
-
-        details {{
-            margin-top: 16px;
-            padding: 16px;
-            background-color: var(--header-bg);
-            border-radius: 6px;
-        }}
-
-        summary {{
-            cursor: pointer;
-            font-weight: 600;
-        }}
-
-        .header-info {{
-            background-color: var(--header-bg);
-            padding: 16px;
-            border-radius: 6px;
-            margin-bottom: 24px;
-        }}
-    </style>
-</head>
-<body>
-{html_body}
-</body>
-</html>"""
+        document = _HTML_DOC.format(
+            style=_HTML_STYLE,
+            title=scan_result.scan_mode.value,
+            body=html_body,
+        )
 
         logger.debug("Generated HTML export")
-        return html
+        return document
 
-    def _markdown_to_html(self, markdown: str) -> str:
+    def to_json(
+        self,
+        scan_result: ScanResult,
+        options: ExportOptions,
+        fp: Optional[TextIO] = None,
+    ) -> Optional[str]:
         """
-        Convert Markdown to HTML (simple implementation).
+        Export scan result as JSON.
 
         Args:
-            markdown: Markdown text
+            scan_result: ScanResult to export
+            options: Export options
+            fp: Optional text file object. If given, the JSON is streamed into
+                it instead of being built as one string.
 
         Returns:
-            HTML text
+            JSON-formatted string, or None when written to fp
         """
-        import re
-
-        html = markdown
-
-        # Headers
-        html = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-        html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-        html = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
-
-        # Bold
-        html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-
-        # Code
-        html = re.sub(r'`([^`]+)`', r'<code>\1</code>', html)
-
-        # Lists
-        html = re.sub(r'^\- (.+)$', r'<li>\1</li>', html, flags=re.MULTILINE)
-        html = re.sub(r'(<li>.*</li>\n)+', r'<ul>\n\g<0></ul>\n', html, flags=re.MULTILINE)
-
-        # Horizontal rule
-        html = re.sub(r'^---$', r'<hr>', html, flags=re.MULTILINE)
+        logger.debug("Generating JSON export")
 
-        # Paragraphs (simple: double newline = paragraph break)
-        html = re.sub(r'\n\n', r'</p>\n<p>', html)
-        html = '<p>' + html + '</p>'
+        data = self._json_data(scan_result, options)
+        logger.debug("Generated JSON export (%s repositories)", len(data['repositories']))
 
-        # Clean up empty paragraphs
-        html = re.sub(r'<p>\s*</p>', '', html)
+        if orjson is not None:
+            text = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+            if fp is not None:
+                fp.write(text)
+                return None
+            return text
 
-        return html
+        if fp is not None:
+            json.dump(data, fp, indent=2, ensure_ascii=False)
+            return None
+        return json.dumps(data, indent=2, ensure_ascii=False)
 
-    def to_json(self, scan_result: ScanResult, options: ExportOptions) -> str:
+    def _json_data(self, scan_result: ScanResult, options: ExportOptions) -> dict:
         """
-        Export scan result as JSON.
+        Build the JSON-serializable export payload.
 
         Args:
             scan_result: ScanResult to export
             options: Export options
 
         Returns:
-            JSON-formatted string
+            Dictionary of plain JSON types
         """
-        logger.debug("Generating JSON export")
-
+        stats = scan_result.aggregate()
         data = {
             "scan_mode": str(scan_result.scan_mode.value),
             "since_date": scan_result.since_date,
             "to_date": scan_result.to_date,
             "scan_time": scan_result.scan_time.isoformat(),
             "statistics": {
-                "total_repos": scan_result.total_repos,
-                "total_commits": scan_result.total_commits,
-                "active_repos": len(scan_result.get_repos_with_activity()),
+                "total_repos": stats.total_repos,
+                "total_commits": stats.total_commits,
+                "active_repos": stats.active_repos,
                 "work_type_distribution": {
-                    str(k.value): v for k, v in scan_result.work_type_distribution.items()
+                    str(k.value): v for k, v in stats.work_type_distribution.items()
                 },
             },
             "repositories": [],
@@ -420,8 +588,7 @@ class Exporter:
 
             data["repositories"].append(repo_data)
 
-        logger.debug(f"Generated JSON export ({len(data['repositories'])} repositories)")
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        return data
 
     def to_pdf(self, scan_result: ScanResult, options: ExportOptions) -> str:
         """
@@ -454,15 +621,20 @@ class Exporter:
         """
         pattern = self.config.export.filename_pattern
 
-        # Replace placeholders
-        filename = pattern.replace("{mode}", str(scan_result.scan_mode.value))
-        filename = filename.replace("{date}", datetime.now().strftime("%Y-%m-%d"))
-        filename = filename.replace("{time}", datetime.now().strftime("%H%M%S"))
+        # Fill placeholders in one pass (one clock read, so {date} and {time} agree)
+        fields = _FilenameFields(str(scan_result.scan_mode.value), datetime.now())
+        try:
+            stem = pattern.format_map(fields)
+        except (ValueError, IndexError):
+            # Stray braces make it an invalid format string; substitute literally
+            stem = pattern
+            for key in ("mode", "date", "time"):
+                stem = stem.replace(f"{{{key}}}", fields[key])
 
         # Add extension
-        filename = f"{filename}.{options.file_extension}"
+        filename = f"{stem}.{options.file_extension}"
 
-        logger.debug(f"Generated filename: {filename}")
+        logger.debug("Generated filename: %s", filename)
         return filename
 
     def save_to_file(
@@ -488,8 +660,13 @@ class Exporter:
 
         logger.info(f"Saving export to file (format: {options.format})")
 
-        # Generate content
-        content = self.export(scan_result, options)
+        # No PDF backend yet: save the Markdown it would fall back to under an
+        # honest .md name instead of rendering it into a misnamed .pdf file
+        if options.format.lower() == "pdf":
+            logger.warning("PDF export not yet implemented, saving Markdown instead")
+            options = replace(options, format="markdown")
+            if output_path is not None and output_path.suffix.lower() == ".pdf":
+                output_path = output_path.with_suffix(".md")
 
         # Determine output path
         if output_path is None:
@@ -500,8 +677,19 @@ class Exporter:
         # Ensure parent directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save file
-        output_path.write_text(content, encoding="utf-8")
+        # Save file; JSON is streamed straight into it without an
+        # intermediate string
+        if options.format.lower() == "json":
+            if orjson is not None:
+                # orjson already produces UTF-8 bytes; skip the decode/encode
+                data = self._json_data(scan_result, options)
+                output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with output_path.open("w", encoding="utf-8") as f:
+                    self.to_json(scan_result, options, fp=f)
+        else:
+            content = self.export(scan_result, options)
+            output_path.write_text(content, encoding="utf-8")
         logger.info(f"Export saved to: {output_path}")
 
         return output_path
@@ -8,10 +8,14 @@ and building structured summaries with progress tracking.
 from __future__ import annotations
 
 import logging
+import os
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Tuple
 
 from core.types import (
     ScanResult,
@@ -24,7 +28,7 @@ from core.types import (
 from core.config import DevDiaryConfig, get_config
 from journal.multi_repo_git_utils import (
     find_git_repos,
-    get_commits_from_repo,
+    get_commit_numstats_from_repo,
     get_today_date,
     get_past_days_date,
     get_first_day_of_month,
@@ -33,57 +37,6 @@ from journal.multi_repo_git_utils import (
 logger = logging.getLogger(__name__)
 
 
-def get_commit_stats(repo_path: Path, commit_hash: str) -> Optional[dict]:
-    """
-    Get commit statistics (files changed, insertions, deletions).
-
-    Args:
-        repo_path: Path to the Git repository
-        commit_hash: Commit hash to analyze
-
-    Returns:
-        Dictionary with 'files_changed', 'insertions', 'deletions', or None on error
-    """
-    import subprocess
-
-    try:
-        result = subprocess.run(
-            ["git", "show", "--shortstat", "--oneline", commit_hash],
-            cwd=repo_path,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-
-        if result.returncode != 0:
-            return None
-
-        # Parse shortstat line like: "3 files changed, 45 insertions(+), 12 deletions(-)"
-        output = result.stdout
-        stats = {"files_changed": 0, "insertions": 0, "deletions": 0}
-
-        # Extract files changed
-        files_match = re.search(r'(\d+) files? changed', output)
-        if files_match:
-            stats["files_changed"] = int(files_match.group(1))
-
-        # Extract insertions
-        insertions_match = re.search(r'(\d+) insertions?\(\+\)', output)
-        if insertions_match:
-            stats["insertions"] = int(insertions_match.group(1))
-
-        # Extract deletions
-        deletions_match = re.search(r'(\d+) deletions?\(-\)', output)
-        if deletions_match:
-            stats["deletions"] = int(deletions_match.group(1))
-
-        return stats
-
-    except Exception as e:
-        logger.warning(f"Failed to get commit stats for {commit_hash}: {e}")
-        return None
-
-
 class RepositoryScanner:
     """
     Service for scanning Git repositories and building structured summaries.
@@ -92,6 +45,27 @@ class RepositoryScanner:
     progress through multi-repository scans.
     """
 
+    # Heuristic keywords per work type, in priority order
+    _WORK_TYPE_KEYWORDS = (
+        (WorkType.BUGFIX, ("fix", "bug", "hotfix", "patch")),
+        (WorkType.FEATURE, ("feat", "feature", "add", "implement")),
+        (WorkType.REFACTOR, ("refactor", "cleanup", "restructure")),
+        (WorkType.DOCS, ("doc", "readme", "changelog")),
+        (WorkType.TEST, ("test", "spec", "unit test", "unittest")),
+        (WorkType.PERF, ("perf", "optimiz")),
+        (WorkType.BUILD, ("build", "packag")),
+        (WorkType.CI, ("ci", "pipeline", "workflow")),
+        (WorkType.CHORE, ("chore", "deps", "dependency", "bump")),
+    )
+    _KEYWORD_RANK = {
+        keyword: rank
+        for rank, (_, keywords) in enumerate(_WORK_TYPE_KEYWORDS)
+        for keyword in keywords
+    }
+    _WORK_TYPE_RE = re.compile(
+        "(?=(" + "|".join(sorted(map(re.escape, _KEYWORD_RANK), key=len, reverse=True)) + "))"
+    )
+
     def __init__(self, config: Optional[DevDiaryConfig] = None):
         """
         Initialize the repository scanner.
@@ -101,7 +75,7 @@ class RepositoryScanner:
         """
         self.config = config if config is not None else get_config()
         logger.info("RepositoryScanner initialized")
-        logger.debug(f"Using root_path: {self.config.scanning.root_path}")
+        logger.debug("Using root_path: %s", self.config.scanning.root_path)
 
     def find_repositories(self, root_path: Optional[Path] = None) -> List[Path]:
         """
@@ -119,7 +93,7 @@ class RepositoryScanner:
         logger.info(f"Finding repositories under {root_path}")
 
         repos = find_git_repos(root_path)
-        logger.debug(f"Found {len(repos)} repositories")
+        logger.debug("Found %s repositories", len(repos))
 
         # Apply max_repos limit if configured
         if self.config.scanning.max_repos is not None:
@@ -138,6 +112,7 @@ class RepositoryScanner:
         repo_path: Path,
         since_date: str,
         to_date: Optional[str] = None,
+        include_stats: bool = True,
     ) -> Optional[RepositorySummary]:
         """
         Scan a single repository for commits within the date range.
@@ -146,35 +121,36 @@ class RepositoryScanner:
             repo_path: Path to the Git repository
             since_date: Start date (ISO format YYYY-MM-DD)
             to_date: End date (ISO format YYYY-MM-DD), optional
+            include_stats: Collect per-commit line counts. When False git skips
+                computing line diffs and insertions/deletions are left at 0.
 
         Returns:
             RepositorySummary with commits, or None if no commits found
         """
         logger.info(f"Scanning repository: {repo_path.name}")
-        logger.debug(f"Date range: {since_date} to {to_date or 'now'}")
-
-        # Get raw commit log
-        raw_log = get_commits_from_repo(repo_path, since_date, to_date)
-
-        if not raw_log:
-            logger.debug(f"No commits found in {repo_path.name}")
+        logger.debug("Date range: %s to %s", since_date, to_date or 'now')
+
+        # Get per-commit records with numstat totals (one git call per repo)
+        try:
+            records = get_commit_numstats_from_repo(
+                repo_path,
+                since_date,
+                to_date,
+                exclude=self.config.scanning.is_excluded,
+                with_stats=include_stats,
+            )
+        except OSError as e:
+            logger.warning(f"Failed to read git log for {repo_path.name}: {e}")
             return None
 
-        # Parse commits
-        commits = self._parse_commits(raw_log, repo_path)
-
-        if not commits:
-            logger.debug(f"No valid commits parsed from {repo_path.name}")
+        if not records:
+            logger.debug("No commits found in %s", repo_path.name)
             return None
 
-        logger.info(f"Found {len(commits)} commits in {repo_path.name}")
+        # Build commits (work type counts are tallied in the same pass)
+        commits, work_type_counts = self._parse_commits(records, repo_path)
 
-        # Build work type counts
-        work_type_counts = {}
-        for commit in commits:
-            work_type_counts[commit.work_type] = (
-                work_type_counts.get(commit.work_type, 0) + 1
-            )
+        logger.info(f"Found {len(commits)} commits in {repo_path.name}")
 
         # Create repository summary
         return RepositorySummary(
@@ -187,71 +163,43 @@ class RepositoryScanner:
             work_type_counts=work_type_counts,
         )
 
-    def _parse_commits(self, raw_log: str, repo_path: Path) -> List[CommitSummary]:
+    def _parse_commits(
+        self, records: List[Tuple[str, str, int, int, int]], repo_path: Path
+    ) -> Tuple[List[CommitSummary], Counter]:
         """
-        Parse raw commit log into structured CommitSummary objects.
+        Build structured CommitSummary objects from parsed commit records.
 
         Args:
-            raw_log: Raw log string with commits separated by ===COMMIT===
-            repo_path: Path to repository (for fetching stats)
+            records: (hash, message, files_changed, insertions, deletions) tuples
+            repo_path: Path to repository
 
         Returns:
-            List of CommitSummary objects
+            Tuple of (CommitSummary list, Counter of WorkType occurrences)
         """
-        logger.debug("Parsing commit blocks")
+        commits = [self._parse_commit_block(record, repo_path) for record in records]
+        work_type_counts = Counter(c.work_type for c in commits)
 
-        blocks = [b.strip() for b in raw_log.split("===COMMIT===") if b.strip()]
-        commits = []
-
-        for block in blocks:
-            commit = self._parse_commit_block(block, repo_path)
-            if commit:
-                commits.append(commit)
-
-        logger.debug(f"Parsed {len(commits)} commits from {len(blocks)} blocks")
-        return commits
+        logger.debug("Built %s commits", len(commits))
+        return commits, work_type_counts
 
     def _parse_commit_block(
-        self, block: str, repo_path: Path
-    ) -> Optional[CommitSummary]:
+        self, record: Tuple[str, str, int, int, int], repo_path: Path
+    ) -> CommitSummary:
         """
-        Parse a single commit block into a CommitSummary.
+        Turn a single commit record into a CommitSummary.
 
         Args:
-            block: Raw commit block text
-            repo_path: Path to repository (for fetching stats)
+            record: (hash, message, files_changed, insertions, deletions) tuple
+            repo_path: Path to repository
 
         Returns:
-            CommitSummary object or None if parsing failed
+            CommitSummary object
         """
-        lines = block.strip().splitlines()
-        if not lines:
-            return None
-
-        # First line is "hash message"
-        first_line = lines[0]
-        parts = first_line.split(maxsplit=1)
-
-        if not parts:
-            return None
-
-        commit_hash = parts[0]
-        message = parts[1] if len(parts) > 1 else ""
+        commit_hash, message, files_changed, insertions, deletions = record
 
         # Heuristic work type classification (will be refined by LLM)
         work_type = self._heuristic_work_type(message)
 
-        # Get commit statistics
-        stats = get_commit_stats(repo_path, commit_hash)
-        if stats:
-            files_changed = stats["files_changed"]
-            insertions = stats["insertions"]
-            deletions = stats["deletions"]
-        else:
-            files_changed = 0
-            insertions = 0
-            deletions = 0
-
         return CommitSummary(
             commit_hash=commit_hash,
             work_type=work_type,
@@ -263,38 +211,36 @@ class RepositoryScanner:
             deletions=deletions,
         )
 
-    def _heuristic_work_type(self, message: str) -> WorkType:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _heuristic_work_type(message: str) -> WorkType:
         """
         Classify commit work type using heuristic keyword matching.
 
+        Pure function of the message, so results are memoized process-wide;
+        repeated subjects ("fix typo", "wip", merges) skip the scan.
+
         Args:
             message: Commit message
 
         Returns:
             WorkType enum value
         """
-        msg_lower = message.lower()
-
-        if any(k in msg_lower for k in ("fix", "bug", "hotfix", "patch")):
-            return WorkType.BUGFIX
-        if any(k in msg_lower for k in ("feat", "feature", "add", "implement")):
-            return WorkType.FEATURE
-        if any(k in msg_lower for k in ("refactor", "cleanup", "restructure")):
-            return WorkType.REFACTOR
-        if any(k in msg_lower for k in ("doc", "readme", "changelog")):
-            return WorkType.DOCS
-        if any(k in msg_lower for k in ("test", "spec", "unit test", "unittest")):
-            return WorkType.TEST
-        if any(k in msg_lower for k in ("perf", "optimiz")):
-            return WorkType.PERF
-        if any(k in msg_lower for k in ("build", "packag")):
-            return WorkType.BUILD
-        if any(k in msg_lower for k in ("ci", "pipeline", "workflow")):
-            return WorkType.CI
-        if any(k in msg_lower for k in ("chore", "deps", "dependency", "bump")):
-            return WorkType.CHORE
-
-        return WorkType.OTHER
+        # One C-level scan: the lookahead reports every (possibly overlapping)
+        # keyword hit, and the lowest rank wins, matching the category order.
+        # Lowercase first rather than using re.IGNORECASE: the latter also
+        # matches non-ASCII letters ("İ", "ſ") that aren't keys of the table
+        best = None
+        for match in RepositoryScanner._WORK_TYPE_RE.finditer(message.lower()):
+            rank = RepositoryScanner._KEYWORD_RANK[match.group(1)]
+            if best is None or rank < best:
+                best = rank
+                if rank == 0:
+                    break
+
+        if best is None:
+            return WorkType.OTHER
+        return RepositoryScanner._WORK_TYPE_KEYWORDS[best][0]
 
     def scan_all(
         self,
@@ -303,6 +249,7 @@ class RepositoryScanner:
         to_date: Optional[str] = None,
         selected_repos: Optional[List[Path]] = None,
         progress_callback: Optional[Callable[[ScanProgress], None]] = None,
+        include_stats: bool = True,
     ) -> ScanResult:
         """
         Scan all repositories and build a complete ScanResult.
@@ -313,6 +260,7 @@ class RepositoryScanner:
             to_date: Optional end date
             selected_repos: Optional list of specific repos to scan
             progress_callback: Optional callback for progress updates
+            include_stats: Collect per-commit line counts (see scan_repository)
 
         Returns:
             ScanResult with all scanned repositories
@@ -335,25 +283,37 @@ class RepositoryScanner:
         total_repos = len(repos)
         logger.info(f"Scanning {total_repos} repositories")
 
-        # Scan each repository
-        summaries: List[RepositorySummary] = []
-
-        for idx, repo_path in enumerate(repos, start=1):
-            # Send progress update
-            if progress_callback:
-                progress = ScanProgress(
-                    total_repos=total_repos,
-                    current_repo=idx,
-                    current_repo_name=repo_path.name,
-                    phase="scanning",
-                    message=f"Scanning {repo_path.name}...",
-                )
-                progress_callback(progress)
-
-            # Scan repository
-            summary = self.scan_repository(repo_path, since_date, to_date)
-            if summary:
-                summaries.append(summary)
+        # Scan repositories concurrently; the work is git subprocess wall time,
+        # so threads overlap it without any pickling cost
+        results: List[Optional[RepositorySummary]] = [None] * total_repos
+        max_workers = self.config.scanning.max_workers or os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, total_repos))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.scan_repository, repo_path, since_date, to_date, include_stats
+                ): idx
+                for idx, repo_path in enumerate(repos)
+            }
+
+            for done, future in enumerate(as_completed(futures), start=1):
+                idx = futures[future]
+                results[idx] = future.result()
+
+                # Send progress update
+                if progress_callback:
+                    progress = ScanProgress(
+                        total_repos=total_repos,
+                        current_repo=done,
+                        current_repo_name=repos[idx].name,
+                        phase="scanning",
+                        message=f"Scanned {repos[idx].name}",
+                    )
+                    progress_callback(progress)
+
+        # Keep the input repository order regardless of completion order
+        summaries: List[RepositorySummary] = [s for s in results if s]
 
         # Final progress update
         if progress_callback:
@@ -7,8 +7,14 @@ using Ollama-powered language models with graceful fallbacks.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Optional, Callable, Dict, Any, List
+import re
+import time
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Optional, Callable, Dict, Any, List
 
 from core.types import (
     ScanResult,
@@ -18,17 +24,80 @@ from core.types import (
     ScanProgress,
 )
 from core.config import DevDiaryConfig, get_config
-from journal.summarize import (
-    classify_and_summarize_commit,
-    generate_repo_standup_paragraph,
-    generate_team_scrum_paragraph,
-    get_ollama_client,
-    _time_window_phrase,
-)
+from core.cache import SummaryCache
+
+# journal.summarize pulls in ollama/httpx; it is imported inside the methods
+# that talk to the LLM so scans run without it never pay for that import
+if TYPE_CHECKING:
+    from ollama import AsyncClient
 
 logger = logging.getLogger(__name__)
 
 
+# How long a probe result is reused before Ollama is asked again, so a server
+# started after a failed probe is still picked up by later scans
+_PROBE_TTL_SECONDS = 60
+
+
+@lru_cache(maxsize=1)
+def _probe_ollama(ttl_bucket: int) -> bool:
+    """
+    Check once per TTL window whether Ollama can be used.
+
+    Probes the shared client from journal.summarize, which every summary
+    request goes through (it uses the default host and llama3, not
+    ``ollama.endpoint``/``ollama.model``). That client is kept once it has
+    been validated, so it is asked to list models again to notice a server
+    that has gone away since.
+
+    Args:
+        ttl_bucket: Current TTL window number; part of the cache key only
+
+    Returns:
+        True if the Ollama server answered
+    """
+    try:
+        from journal.summarize import get_ollama_client
+
+        logger.debug("Testing Ollama connection...")
+        get_ollama_client().list()
+        logger.info("LLM is available and ready")
+        return True
+    except Exception as e:
+        logger.warning(f"LLM is not available: {e}")
+        return False
+
+
+# Conventional Commits header: type(scope)!: description. These classify
+# deterministically, so they never need an LLM round-trip.
+_CONVENTIONAL_COMMIT_RE = re.compile(
+    r"^(feat|fix|docs|test|refactor|perf|build|ci|chore)(\([^)]*\))?!?:\s*(.+)",
+    re.IGNORECASE,
+)
+
+_CONVENTIONAL_WORK_TYPES = {
+    "feat": WorkType.FEATURE,
+    "fix": WorkType.BUGFIX,
+    "docs": WorkType.DOCS,
+    "test": WorkType.TEST,
+    "refactor": WorkType.REFACTOR,
+    "perf": WorkType.PERF,
+    "build": WorkType.BUILD,
+    "ci": WorkType.CI,
+    "chore": WorkType.CHORE,
+}
+
+
+# WorkType -> its string value; a dict hit is cheaper than the Enum.value
+# descriptor when formatting thousands of fallback bullets
+_WORK_TYPE_STR = {wt: wt.value for wt in WorkType}
+
+
+def _coerce_work_type(value: Any) -> WorkType:
+    """Map an LLM/cache work_type string to a WorkType; unknown values become OTHER."""
+    return WorkType._value2member_map_.get(str(value).lower(), WorkType.OTHER)
+
+
 class SummarizationError(Exception):
     """Exception raised when summarization fails."""
     pass
@@ -51,6 +120,7 @@ class LLMSummarizer:
         """
         self.config = config if config is not None else get_config()
         self._ollama_available: Optional[bool] = None
+        self._cache: Optional[SummaryCache] = None
         logger.info("LLMSummarizer initialized")
         logger.debug(f"Ollama enabled in config: {self.config.ollama.enabled}")
         logger.debug(f"Ollama model: {self.config.ollama.model}")
@@ -72,17 +142,29 @@ class LLMSummarizer:
             self._ollama_available = False
             return False
 
-        # Test Ollama connection
-        try:
-            logger.debug("Testing Ollama connection...")
-            get_ollama_client()
-            logger.info("LLM is available and ready")
-            self._ollama_available = True
-            return True
-        except Exception as e:
-            logger.warning(f"LLM is not available: {e}")
-            self._ollama_available = False
-            return False
+        # Test Ollama connection (shared by every summarizer in the process)
+        self._ollama_available = _probe_ollama(int(time.monotonic() // _PROBE_TTL_SECONDS))
+        return self._ollama_available
+
+    def _get_cache(self) -> Optional[SummaryCache]:
+        """
+        Get the persistent summary cache, opening it on first use.
+
+        Returns:
+            SummaryCache instance, or None if caching is disabled or unavailable
+        """
+        if not self.config.cache.enabled:
+            return None
+
+        if self._cache is None:
+            try:
+                self._cache = SummaryCache(self.config)
+            except Exception as e:
+                logger.warning(f"Summary cache unavailable, continuing without it: {e}")
+                self.config.cache.enabled = False
+                return None
+
+        return self._cache
 
     def summarize_commit(
         self,
@@ -107,9 +189,13 @@ class LLMSummarizer:
         """
         if not self.is_available():
             logger.debug(f"LLM not available, using basic summary for {commit.commit_hash}")
-            # Return commit with basic bullet
-            commit.bullet = f"- [{commit.work_type.value}] `{commit.commit_hash}`: {commit.message}"
-            commit.team_snippet = commit.message[:60].rstrip(".")
+            return self._apply_basic_summary(commit)
+
+        if self._apply_conventional_summary(commit):
+            return commit
+
+        cache, cache_key = self._cache_lookup(commit, repo_name)
+        if cache_key is None:
             return commit
 
         try:
@@ -119,29 +205,325 @@ class LLMSummarizer:
             commit_block = f"{commit.commit_hash} {commit.message}"
 
             # Call LLM classifier
+            from journal.summarize import classify_and_summarize_commit
+
             result = classify_and_summarize_commit(
                 commit_block=commit_block,
                 repo_name=repo_name,
                 since_date=since_date,
                 to_date=to_date,
                 mode=mode,
+                # the SQLite cache above is keyed by model + PROMPT_VERSION;
+                # the journal JSON cache isn't, so it must not answer here
+                use_cache=False,
             )
+            return self._apply_result(commit, result, cache, cache_key)
 
-            # Update commit with LLM results
-            commit.work_type = WorkType(result.get("work_type", "other"))
-            commit.bullet = result.get("bullet", commit.bullet)
-            commit.team_snippet = result.get("team_snippet", commit.team_snippet)
+        except Exception as e:
+            logger.warning(f"Failed to summarize commit {commit.commit_hash}: {type(e).__name__}: {str(e)[:200]}")
+            return self._apply_basic_summary(commit)
 
-            logger.debug(f"Successfully summarized {commit.commit_hash} as {commit.work_type.value}")
+    async def _summarize_commit_async(
+        self,
+        commit: CommitSummary,
+        repo_name: str,
+        since_date: str,
+        to_date: Optional[str],
+        mode: str,
+        client: AsyncClient,
+    ) -> CommitSummary:
+        """
+        Async variant of summarize_commit() using a shared ollama.AsyncClient.
+
+        Args:
+            commit: CommitSummary to enhance
+            repo_name: Name of the repository
+            since_date: Start date for context
+            to_date: End date for context
+            mode: Scan mode for context
+            client: AsyncClient bound to the running event loop
+
+        Returns:
+            Enhanced CommitSummary with LLM-generated content
+        """
+        if self._apply_conventional_summary(commit):
             return commit
 
-        except Exception as e:
-            logger.warning(f"Failed to summarize commit {commit.commit_hash}: {e}")
-            # Fallback to basic summary
-            commit.bullet = f"- [{commit.work_type.value}] `{commit.commit_hash}`: {commit.message}"
-            commit.team_snippet = commit.message[:60].rstrip(".")
+        cache, cache_key = await asyncio.to_thread(self._cache_lookup, commit, repo_name)
+        if cache_key is None:
             return commit
 
+        try:
+            logger.debug(f"Summarizing commit {commit.commit_hash} with LLM (async)")
+            from journal.summarize import classify_and_summarize_commit_async
+
+            result = await classify_and_summarize_commit_async(
+                commit_block=f"{commit.commit_hash} {commit.message}",
+                repo_name=repo_name,
+                since_date=since_date,
+                to_date=to_date,
+                mode=mode,
+                client=client,
+                use_cache=False,  # see summarize_commit
+            )
+            return await asyncio.to_thread(self._apply_result, commit, result, cache, cache_key)
+
+        except Exception as e:
+            logger.warning(f"Failed to summarize commit {commit.commit_hash}: {type(e).__name__}: {str(e)[:200]}")
+            return self._apply_basic_summary(commit)
+
+    @staticmethod
+    def _apply_conventional_summary(commit: CommitSummary) -> bool:
+        """
+        Summarize a Conventional Commits message without the LLM.
+
+        Args:
+            commit: CommitSummary to enhance
+
+        Returns:
+            True if the message matched and the commit was filled in
+        """
+        match = _CONVENTIONAL_COMMIT_RE.match(commit.message)
+        if match is None:
+            return False
+        description = match.group(3).strip()
+        commit.work_type = _CONVENTIONAL_WORK_TYPES[match.group(1).lower()]
+        commit.bullet = f"- [{commit.work_type.value}] `{commit.commit_hash}`: {description}"
+        commit.team_snippet = description[:60].rstrip(".")
+        logger.debug(f"Classified {commit.commit_hash} from its Conventional Commits prefix")
+        return True
+
+    @staticmethod
+    def _apply_basic_summary(commit: CommitSummary) -> CommitSummary:
+        """Fill in the non-LLM bullet and team snippet for a commit."""
+        commit.bullet = f"- [{_WORK_TYPE_STR[commit.work_type]}] `{commit.commit_hash}`: {commit.message}"
+        commit.team_snippet = commit.message[:60].rstrip(".")
+        return commit
+
+    def _cache_lookup(
+        self, commit: CommitSummary, repo_name: str
+    ) -> tuple[Optional[SummaryCache], Optional[str]]:
+        """
+        Apply a persistent cache hit to the commit, if there is one.
+
+        Args:
+            commit: CommitSummary to enhance
+            repo_name: Name of the repository
+
+        Returns:
+            (cache, cache_key) for storing a fresh result; cache_key is None
+            when the commit was filled from the cache
+        """
+        from journal.summarize import PROMPT_VERSION
+
+        cache = self._get_cache()
+        cache_key = SummaryCache.make_key(
+            repo_name, commit.commit_hash, self.config.ollama.model, PROMPT_VERSION
+        )
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                self._apply_cached(commit, cached)
+                return cache, None
+        return cache, cache_key
+
+    @staticmethod
+    def _apply_cached(commit: CommitSummary, cached: Dict[str, Any]) -> CommitSummary:
+        """Fill a commit from a persistent cache entry."""
+        logger.debug(f"Using cached summary for commit {commit.commit_hash}")
+        commit.work_type = _coerce_work_type(cached.get("work_type", "other"))
+        commit.bullet = cached.get("bullet", commit.bullet)
+        commit.team_snippet = cached.get("team_snippet", commit.team_snippet)
+        return commit
+
+    def _apply_result(
+        self,
+        commit: CommitSummary,
+        result: Dict[str, Any],
+        cache: Optional[SummaryCache],
+        cache_key: str,
+    ) -> CommitSummary:
+        """
+        Update the commit from an LLM result and persist it.
+
+        Args:
+            commit: CommitSummary to enhance
+            result: Classifier output dict
+            cache: Persistent cache, or None if disabled
+            cache_key: Key to store the result under
+
+        Returns:
+            Enhanced CommitSummary
+        """
+        # Update commit with LLM results
+        commit.work_type = _coerce_work_type(result.get("work_type", "other"))
+        commit.bullet = result.get("bullet", commit.bullet)
+        commit.team_snippet = result.get("team_snippet", commit.team_snippet)
+
+        # Only persist real LLM output, never error fallbacks
+        if cache is not None and "summary unavailable" not in commit.bullet:
+            cache.put(cache_key, {
+                "work_type": commit.work_type.value,
+                "bullet": commit.bullet,
+                "team_snippet": commit.team_snippet,
+            })
+
+        logger.debug(f"Successfully summarized {commit.commit_hash} as {commit.work_type.value}")
+        return commit
+
+    async def summarize_batch(
+        self,
+        commits: List[CommitSummary],
+        repo_name: str,
+        since_date: str,
+        to_date: Optional[str],
+        mode: str,
+        client: Optional[AsyncClient] = None,
+    ) -> List[CommitSummary]:
+        """
+        Summarize several commits concurrently.
+
+        Requests go out through one ollama.AsyncClient on the running event
+        loop, with at most ``ollama.max_concurrent`` in flight so the Ollama
+        server can process them in parallel (see OLLAMA_NUM_PARALLEL).
+
+        Args:
+            commits: CommitSummary objects to enhance
+            repo_name: Name of the repository
+            since_date: Start date for context
+            to_date: End date for context
+            mode: Scan mode for context
+            client: AsyncClient to use; without one, a client is opened and
+                closed for this call
+
+        Returns:
+            Enhanced CommitSummary objects, in the same order as ``commits``
+        """
+        if not self.is_available():
+            return [self._apply_basic_summary(c) for c in commits]
+
+        if client is None:
+            from journal.summarize import open_async_ollama_client
+
+            async with open_async_ollama_client() as client:
+                return await self.summarize_batch(
+                    commits, repo_name, since_date, to_date, mode, client
+                )
+
+        semaphore = asyncio.Semaphore(max(1, self.config.ollama.max_concurrent))
+
+        async def bounded(commit: CommitSummary) -> CommitSummary:
+            async with semaphore:
+                return await self._summarize_commit_async(
+                    commit, repo_name, since_date, to_date, mode, client
+                )
+
+        return list(await asyncio.gather(*(bounded(c) for c in commits)))
+
+    async def summarize_commits_batched(
+        self,
+        commits: List[CommitSummary],
+        repo_name: str,
+        since_date: str,
+        to_date: Optional[str],
+        mode: str,
+        batch_size: int = 8,
+        client: Optional[AsyncClient] = None,
+    ) -> List[CommitSummary]:
+        """
+        Summarize commits several at a time, one LLM request per chunk.
+
+        Conventional Commits messages and cache hits are resolved first so
+        only the remaining commits are sent. A chunk whose reply can't be
+        parsed or aligned is retried commit by commit. With ``batch_size``
+        <= 1 this is the same as summarize_batch().
+
+        Args:
+            commits: CommitSummary objects to enhance
+            repo_name: Name of the repository
+            since_date: Start date for context
+            to_date: End date for context
+            mode: Scan mode for context
+            batch_size: Number of commits per LLM request
+            client: AsyncClient to use; without one, a client is opened and
+                closed for this call
+
+        Returns:
+            Enhanced CommitSummary objects, in the same order as ``commits``
+        """
+        if batch_size <= 1 or not self.is_available():
+            return await self.summarize_batch(commits, repo_name, since_date, to_date, mode, client)
+
+        from journal.summarize import (
+            PROMPT_VERSION,
+            classify_and_summarize_commits_batch_async,
+            open_async_ollama_client,
+        )
+
+        if client is None:
+            async with open_async_ollama_client() as client:
+                return await self.summarize_commits_batched(
+                    commits, repo_name, since_date, to_date, mode, batch_size, client
+                )
+
+        cache = self._get_cache()
+        model = self.config.ollama.model
+        unresolved = [c for c in commits if not self._apply_conventional_summary(c)]
+        keys = [
+            SummaryCache.make_key(repo_name, c.commit_hash, model, PROMPT_VERSION)
+            for c in unresolved
+        ]
+        # One lookup for the whole repository instead of one query per commit
+        hits = await asyncio.to_thread(cache.get_many, keys) if cache is not None else {}
+        pending = []
+        for commit, cache_key in zip(unresolved, keys):
+            cached = hits.get(cache_key)
+            if cached is not None:
+                self._apply_cached(commit, cached)
+            else:
+                pending.append((commit, cache_key))
+
+        semaphore = asyncio.Semaphore(max(1, self.config.ollama.max_concurrent))
+
+        async def run_chunk(chunk: List[tuple[CommitSummary, str]]) -> None:
+            async with semaphore:
+                try:
+                    results = await classify_and_summarize_commits_batch_async(
+                        [f"{c.commit_hash} {c.message}" for c, _ in chunk],
+                        repo_name=repo_name,
+                        since_date=since_date,
+                        to_date=to_date,
+                        mode=mode,
+                        client=client,
+                    )
+                    if results is not None:
+                        fresh = {}
+                        for (commit, cache_key), result in zip(chunk, results):
+                            self._apply_result(commit, result, None, cache_key)
+                            if "summary unavailable" not in commit.bullet:
+                                fresh[cache_key] = {
+                                    "work_type": commit.work_type.value,
+                                    "bullet": commit.bullet,
+                                    "team_snippet": commit.team_snippet,
+                                }
+                        if cache is not None:
+                            await asyncio.to_thread(cache.put_many, fresh)
+                        return
+                except Exception as e:
+                    # One bad chunk must not send the whole repository to
+                    # the basic-summary fallback
+                    logger.warning(f"Batch of {len(chunk)} commits failed: {type(e).__name__}: {str(e)[:200]}")
+                logger.debug(f"Retrying a batch of {len(chunk)} commits individually")
+                for commit, _ in chunk:
+                    await self._summarize_commit_async(
+                        commit, repo_name, since_date, to_date, mode, client
+                    )
+
+        it = iter(pending)
+        chunks = list(iter(lambda: list(islice(it, batch_size)), []))
+        await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+        return commits
+
     def summarize_repository(
         self,
         repo_summary: RepositorySummary,
@@ -161,75 +543,114 @@ class LLMSummarizer:
         Returns:
             Enhanced RepositorySummary with LLM-generated summaries
         """
-        logger.info(f"Summarizing repository: {repo_summary.repo_name}")
-
         if not self.is_available():
             logger.debug(f"LLM not available, using basic summaries for {repo_summary.repo_name}")
             # Create basic bullets from commit messages
-            repo_summary.bullets = [
-                f"- [{c.work_type.value}] `{c.commit_hash}`: {c.message}"
-                for c in repo_summary.commits
-            ]
-            repo_summary.team_snippets = [
-                c.message[:60].rstrip(".") for c in repo_summary.commits
-            ]
-            repo_summary.standup_summary = (
-                f"In {repo_summary.repo_name}, made {repo_summary.commit_count} commits."
-            )
-            return repo_summary
+            return self._apply_basic_repo_summary(repo_summary)
 
-        try:
-            # Summarize each commit with LLM
-            logger.debug(f"Summarizing {len(repo_summary.commits)} commits in {repo_summary.repo_name}")
+        from journal.summarize import open_async_ollama_client
 
-            summarized_commits: List[CommitSummary] = []
-            for commit in repo_summary.commits:
-                summarized = self.summarize_commit(
-                    commit, repo_summary.repo_name, since_date, to_date, mode
+        async def run() -> RepositorySummary:
+            async with open_async_ollama_client() as client:
+                return await self._summarize_repository_async(
+                    repo_summary, since_date, to_date, mode, client
                 )
-                summarized_commits.append(summarized)
 
-            # Update repository with summarized commits
-            repo_summary.commits = summarized_commits
+        return asyncio.run(run())
 
-            # Extract bullets and snippets
-            repo_summary.bullets = [c.bullet for c in summarized_commits]
-            repo_summary.team_snippets = [c.team_snippet for c in summarized_commits]
+    async def _summarize_repository_async(
+        self,
+        repo_summary: RepositorySummary,
+        since_date: str,
+        to_date: Optional[str],
+        mode: str,
+        client: AsyncClient,
+    ) -> RepositorySummary:
+        """
+        Coroutine behind summarize_repository(), using the caller's client.
 
-            # Recalculate work type counts
-            work_type_counts: Dict[WorkType, int] = {}
-            for commit in summarized_commits:
-                work_type_counts[commit.work_type] = (
-                    work_type_counts.get(commit.work_type, 0) + 1
-                )
+        Args:
+            repo_summary: RepositorySummary to enhance
+            since_date: Start date for context
+            to_date: End date for context
+            mode: Scan mode for context
+            client: AsyncClient bound to the running event loop
+
+        Returns:
+            Enhanced RepositorySummary with LLM-generated summaries
+        """
+        logger.info(f"Summarizing repository: {repo_summary.repo_name}")
+
+        try:
+            # Summarize each commit with LLM
+            logger.debug(f"Summarizing {len(repo_summary.commits)} commits in {repo_summary.repo_name}")
+
+            # Commits are updated in place, so the returned list isn't kept
+            commits = repo_summary.commits
+            await self.summarize_commits_batched(
+                commits, repo_summary.repo_name, since_date, to_date, mode,
+                batch_size=self.config.ollama.batch_size,
+                client=client,
+            )
+
+            # Extract bullets and snippets and recount work types in one pass
+            bullets, snippets = [], []
+            work_type_counts: Counter = Counter()
+            for c in commits:
+                bullets.append(c.bullet)
+                snippets.append(c.team_snippet)
+                work_type_counts[c.work_type] += 1
+            repo_summary.bullets = bullets
+            repo_summary.team_snippets = snippets
             repo_summary.work_type_counts = work_type_counts
 
             # Generate standup paragraph
+            from journal.summarize import _time_window_phrase, generate_repo_standup_paragraph
+
             time_window = _time_window_phrase(mode, since_date, to_date)
-            repo_summary.standup_summary = generate_repo_standup_paragraph(
+            repo_summary.standup_summary = await asyncio.to_thread(
+                generate_repo_standup_paragraph,
                 repo_name=repo_summary.repo_name,
                 time_window=time_window,
                 bullets=repo_summary.bullets,
                 team_snips=repo_summary.team_snippets,
             )
 
-            logger.info(f"Successfully summarized {repo_summary.repo_name} ({len(summarized_commits)} commits)")
+            logger.info(f"Successfully summarized {repo_summary.repo_name} ({len(commits)} commits)")
             return repo_summary
 
         except Exception as e:
-            logger.error(f"Failed to summarize repository {repo_summary.repo_name}: {e}", exc_info=True)
+            # Full traceback is left to summarize_scan_result's handler
+            logger.error(f"Failed to summarize repository {repo_summary.repo_name}: {type(e).__name__}: {str(e)[:200]}")
             # Fallback to basic summaries
-            repo_summary.bullets = [
-                f"- [{c.work_type.value}] `{c.commit_hash}`: {c.message}"
-                for c in repo_summary.commits
-            ]
-            repo_summary.team_snippets = [
-                c.message[:60].rstrip(".") for c in repo_summary.commits
-            ]
-            repo_summary.standup_summary = (
-                f"In {repo_summary.repo_name}, made {repo_summary.commit_count} commits."
-            )
-            return repo_summary
+            return self._apply_basic_repo_summary(repo_summary)
+
+    @staticmethod
+    def _apply_basic_repo_summary(repo_summary: RepositorySummary) -> RepositorySummary:
+        """
+        Fill in non-LLM bullets, snippets and counts from the commit messages.
+
+        Args:
+            repo_summary: RepositorySummary to fill in
+
+        Returns:
+            The same RepositorySummary with a basic standup line
+        """
+        bullets, snippets = [], []
+        work_type_counts: Counter = Counter()
+        for c in repo_summary.commits:
+            work_type = c.work_type
+            message = c.message
+            bullets.append(f"- [{_WORK_TYPE_STR[work_type]}] `{c.commit_hash}`: {message}")
+            snippets.append(message[:60].rstrip("."))
+            work_type_counts[work_type] += 1
+        repo_summary.bullets = bullets
+        repo_summary.team_snippets = snippets
+        repo_summary.work_type_counts = work_type_counts
+        repo_summary.standup_summary = (
+            f"In {repo_summary.repo_name}, made {repo_summary.commit_count} commits."
+        )
+        return repo_summary
 
     def summarize_scan_result(
         self,
@@ -254,29 +675,36 @@ class LLMSummarizer:
 
         try:
             total_repos = len(scan_result.repositories)
-            summarized_repos: List[RepositorySummary] = []
-
-            # Summarize each repository
-            for idx, repo in enumerate(scan_result.repositories, start=1):
-                # Send progress update
-                if progress_callback:
-                    progress = ScanProgress(
-                        total_repos=total_repos,
-                        current_repo=idx,
-                        current_repo_name=repo.repo_name,
-                        phase="summarizing",
-                        message=f"Summarizing {repo.repo_name}...",
-                    )
-                    progress_callback(progress)
-
-                # Summarize repository
-                summarized_repo = self.summarize_repository(
-                    repo,
-                    since_date=scan_result.since_date or "",
-                    to_date=scan_result.to_date,
-                    mode=str(scan_result.scan_mode),
-                )
-                summarized_repos.append(summarized_repo)
+            from journal.summarize import open_async_ollama_client
+
+            # One event loop and one AsyncClient for every repository, so
+            # its HTTP connections are reused across the whole scan
+            async def summarize_all() -> List[RepositorySummary]:
+                summarized: List[RepositorySummary] = []
+                async with open_async_ollama_client() as client:
+                    for idx, repo in enumerate(scan_result.repositories, start=1):
+                        # Send progress update
+                        if progress_callback:
+                            progress = ScanProgress(
+                                total_repos=total_repos,
+                                current_repo=idx,
+                                current_repo_name=repo.repo_name,
+                                phase="summarizing",
+                                message=f"Summarizing {repo.repo_name}...",
+                            )
+                            progress_callback(progress)
+
+                        # Summarize repository
+                        summarized.append(await self._summarize_repository_async(
+                            repo,
+                            since_date=scan_result.since_date or "",
+                            to_date=scan_result.to_date,
+                            mode=str(scan_result.scan_mode),
+                            client=client,
+                        ))
+                return summarized
+
+            summarized_repos = asyncio.run(summarize_all())
 
             # Update scan result with summarized repos
             scan_result.repositories = summarized_repos
@@ -293,6 +721,8 @@ class LLMSummarizer:
                 for r in summarized_repos
             ]
 
+            from journal.summarize import generate_team_scrum_paragraph
+
             scan_result.team_summary = generate_team_scrum_paragraph(
                 repo_summaries=repo_summaries,
                 since_date=scan_result.since_date or "",
@@ -339,6 +769,8 @@ class LLMSummarizer:
             }
 
         try:
+            from journal.summarize import get_ollama_client
+
             client = get_ollama_client()
             logger.debug("Successfully connected to Ollama")
 
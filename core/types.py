@@ -7,11 +7,14 @@ Git commit summaries, repository analysis, and scan results.
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, NamedTuple, Optional, Dict
 
 
 class WorkType(Enum):
@@ -42,7 +45,7 @@ class ScanMode(Enum):
         return self.value
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitSummary:
     """
     Summary of a single Git commit with classification and statistics.
@@ -69,13 +72,19 @@ class CommitSummary:
     def __post_init__(self):
         """Ensure work_type is a WorkType enum."""
         if isinstance(self.work_type, str):
-            try:
-                self.work_type = WorkType(self.work_type.lower())
-            except ValueError:
-                self.work_type = WorkType.OTHER
+            # Direct value lookup; skips Enum.__call__ and the try/except
+            self.work_type = WorkType._value2member_map_.get(self.work_type.lower(), WorkType.OTHER)
 
 
-@dataclass
+# Field getters for the aggregation properties below; map() over these runs
+# the per-commit loop in C instead of a Python generator
+_work_type = attrgetter("work_type")
+_files_changed = attrgetter("files_changed")
+_insertions = attrgetter("insertions")
+_deletions = attrgetter("deletions")
+
+
+@dataclass(slots=True)
 class RepositorySummary:
     """
     Summary of all activity within a single Git repository.
@@ -110,20 +119,42 @@ class RepositorySummary:
     @property
     def total_files_changed(self) -> int:
         """Return the total number of files changed across all commits."""
-        return sum(commit.files_changed for commit in self.commits)
+        return sum(map(_files_changed, self.commits))
 
     @property
     def total_insertions(self) -> int:
         """Return the total number of lines inserted across all commits."""
-        return sum(commit.insertions for commit in self.commits)
+        return sum(map(_insertions, self.commits))
 
     @property
     def total_deletions(self) -> int:
         """Return the total number of lines deleted across all commits."""
-        return sum(commit.deletions for commit in self.commits)
+        return sum(map(_deletions, self.commits))
+
+
+class ScanAggregate(NamedTuple):
+    """
+    Scan-wide statistics gathered in one sweep over the repositories.
 
+    Attributes:
+        total_repos: Number of repositories scanned
+        active_repos: Number of repositories with at least one commit
+        total_commits: Number of commits across all repositories
+        work_type_distribution: Counter mapping WorkType to count
+        files_changed: Files changed across all commits
+        insertions: Lines added across all commits
+        deletions: Lines removed across all commits
+    """
+    total_repos: int
+    active_repos: int
+    total_commits: int
+    work_type_distribution: Counter
+    files_changed: int
+    insertions: int
+    deletions: int
 
-@dataclass
+
+@dataclass(slots=True)
 class ScanResult:
     """
     Complete results from a DevDiary repository scan.
@@ -146,10 +177,7 @@ class ScanResult:
     def __post_init__(self):
         """Ensure scan_mode is a ScanMode enum."""
         if isinstance(self.scan_mode, str):
-            try:
-                self.scan_mode = ScanMode(self.scan_mode.lower())
-            except ValueError:
-                self.scan_mode = ScanMode.TODAY
+            self.scan_mode = ScanMode._value2member_map_.get(self.scan_mode.lower(), ScanMode.TODAY)
 
     @property
     def total_repos(self) -> int:
@@ -169,11 +197,40 @@ class ScanResult:
         Returns:
             Dictionary mapping WorkType to total count across all repos
         """
-        distribution: Dict[WorkType, int] = {}
+        commits = chain.from_iterable(repo.commits for repo in self.repositories)
+        return Counter(map(_work_type, commits))
+
+    def aggregate(self) -> ScanAggregate:
+        """
+        Compute all scan-wide statistics in a single pass over repositories.
+
+        Callers that need several of them (e.g. the export overview) should
+        use this instead of reading the individual properties one by one.
+        Not cached, since the summarizer may still reclassify commits.
+
+        Returns:
+            ScanAggregate with counts, work type distribution and line totals
+        """
+        distribution: Counter = Counter()
+        active = commits = files = insertions = deletions = 0
         for repo in self.repositories:
-            for commit in repo.commits:
-                distribution[commit.work_type] = distribution.get(commit.work_type, 0) + 1
-        return distribution
+            count = len(repo.commits)
+            if count:
+                active += 1
+                commits += count
+                distribution.update(map(_work_type, repo.commits))
+                files += repo.total_files_changed
+                insertions += repo.total_insertions
+                deletions += repo.total_deletions
+        return ScanAggregate(
+            total_repos=len(self.repositories),
+            active_repos=active,
+            total_commits=commits,
+            work_type_distribution=distribution,
+            files_changed=files,
+            insertions=insertions,
+            deletions=deletions,
+        )
 
     def get_repos_with_activity(self) -> List[RepositorySummary]:
         """
@@ -185,7 +242,7 @@ class ScanResult:
         return [repo for repo in self.repositories if repo.commit_count > 0]
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanProgress:
     """
     Progress tracking for repository scanning operations.
@@ -226,7 +283,7 @@ class ScanProgress:
         return self.phase == "complete"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportOptions:
     """
     Configuration options for exporting scan results.
@@ -1,56 +1,185 @@
 import sys
 import os
 import re
+from contextlib import contextmanager
+from functools import lru_cache
+from html import escape
 from pathlib import Path
+from typing import Callable
 from PyQt5.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
-    QLabel, QCheckBox, QComboBox, QFileDialog, QLineEdit, QDateEdit,
-    QListWidget, QListWidgetItem
+    QApplication, QWidget, QVBoxLayout, QTextEdit, QPushButton, QLabel,
+    QCheckBox, QComboBox, QLineEdit, QDateEdit, QListWidget, QListWidgetItem,
+    QScrollArea, QFrame, QToolButton, QSizePolicy, QProgressBar,
 )
+from PyQt5.QtCore import QDate, Qt, QObject, QRunnable, QThread, QThreadPool, pyqtSignal, pyqtSlot
 
-from PyQt5.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
-    QLabel, QCheckBox, QComboBox, QFileDialog, QLineEdit, QScrollArea, QFrame
-)
-from PyQt5.QtCore import QDate, Qt
-from PyQt5.QtWidgets import QDateEdit, QListWidget, QListWidgetItem, QToolButton, QSizePolicy
+from journal.date_utils import resolve_since_date
+from journal.export import write_markdown_export
+
+from journal.multi_repo_git_utils import get_all_commits_across_repos, find_git_repos, find_git_repos_cached, get_all_commits_across_repos_structured
+
+try:
+    import cmarkgfm  # optional C (cmark-gfm) renderer, much faster on big summaries
+    from cmarkgfm.cmark import Options as cmarkgfmOptions
+except ImportError:
+    cmarkgfm = None
+
+# bold | code | header, compiled once and applied in a single pass
+_MD_RE = re.compile(r'\*\*(.*?)\*\*|`([^`]*)`|### (.*?)\n')
+
+
+def _md_repl(m: re.Match) -> str:
+    if m.group(1) is not None:
+        # bold and header text may still contain code spans / bold
+        return f"<b>{_MD_RE.sub(_md_repl, m.group(1))}</b>"
+    if m.group(2) is not None:
+        return f"<code>{m.group(2)}</code>"
+    return f"<h3>{_MD_RE.sub(_md_repl, m.group(3))}</h3>"
+
+
+def _code_spans(text: str) -> str:
+    # Same output as _MD_RE for text with no bold or header markers, which
+    # is nearly every commit bullet, without going through the regex engine
+    out = []
+    i = 0
+    while True:
+        a = text.find('`', i)
+        if a < 0:
+            break
+        b = text.find('`', a + 1)
+        if b < 0:
+            break
+        out.append(text[i:a])
+        out.append('<code>')
+        out.append(text[a + 1:b])
+        out.append('</code>')
+        i = b + 1
+    out.append(text[i:])
+    return ''.join(out)
 
-from PyQt5.QtCore import QDate
 
-from journal.date_utils import resolve_since_date
+def markdown_to_html(text: str) -> str:
+    if cmarkgfm is not None:
+        # Every input goes through cmark when it is installed (a size cutoff
+        # made a repo's bullets render as a list or as plain lines depending
+        # on how many there were); HARDBREAKS keeps one line per paragraph
+        return cmarkgfm.github_flavored_markdown_to_html(text, options=cmarkgfmOptions.CMARK_OPT_HARDBREAKS)
+    if '**' not in text and '### ' not in text:
+        return _code_spans(text).replace('\n', '<br>')
+    return _MD_RE.sub(_md_repl, text).replace('\n', '<br>')
+
+
+def rich_label(html: str) -> QLabel:
+    # Read-only HTML: a QLabel skips the QTextDocument/editor machinery a
+    # QTextEdit spins up per instance, and sizes itself to its content
+    label = QLabel()
+    label.setTextFormat(Qt.RichText)
+    label.setWordWrap(True)
+    label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+    label.setText(html)
+    return label
+
+
+@contextmanager
+def updates_suspended(widget: QWidget):
+    # Batch several child additions/removals into one layout + repaint
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+        widget.update()
 
-from journal.multi_repo_git_utils import get_all_commits_across_repos, find_git_repos,get_all_commits_across_repos_structured
 
+def plain_to_html(text: str) -> str:
+    return escape(text, quote=False).replace('\n', '<br>')
+
+
+def _git_activity_stamp(repo_paths) -> tuple:
+    # A commit, pull or checkout rewrites .git/index or appends to the HEAD
+    # reflog, so their mtimes change whenever a re-run could find new commits
+    stamp = []
+    for p in repo_paths:
+        mtimes = [0]
+        for name in ("index", os.path.join("logs", "HEAD")):
+            try:
+                mtimes.append(os.stat(os.path.join(p, ".git", name)).st_mtime_ns)
+            except OSError:
+                pass
+        stamp.append(max(mtimes))
+    return tuple(stamp)
+
+
+# Repo sections kept alive between runs; beyond this many the oldest go
+_SECTION_POOL_MAX = 256
 
 
-def markdown_to_html(text: str) -> str:
-    text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', text)
-    text = re.sub(r'`([^`]*)`', r'<code>\1</code>', text)
-    text = re.sub(r'### (.*?)\n', r'<h3>\1</h3>', text)
-    text = text.replace('\n', '<br>')
-    return text
 class CollapsibleSection(QWidget):
-    def __init__(self, title: str, content_widget: QWidget, parent=None):
+    # builder makes the content widget; it's only called the first time the
+    # section is expanded, so a long run only pays for the headers up front
+    def __init__(self, title: str, builder: Callable[[], QWidget], start_collapsed: bool = True, parent=None):
         super().__init__(parent)
-        self.toggle = QToolButton(text=title, checkable=True, checked=True)
+        self._builder = builder
+        self._built = False
+
+        self.toggle = QToolButton(text=title, checkable=True, checked=not start_collapsed)
         self.toggle.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
-        self.toggle.setArrowType(Qt.DownArrow)
         self.toggle.clicked.connect(self._on_toggled)
 
         self.content_area = QScrollArea()
         self.content_area.setWidgetResizable(True)
         self.content_area.setFrameShape(QFrame.NoFrame)
-        self.content_area.setWidget(content_widget)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(self.toggle)
         layout.addWidget(self.content_area)
 
+        self._on_toggled(not start_collapsed)
+
     def _on_toggled(self, checked: bool):
+        if checked and not self._built:
+            self.content_area.setWidget(self._builder())
+            self._built = True
         self.toggle.setArrowType(Qt.DownArrow if checked else Qt.RightArrow)
         self.content_area.setVisible(checked)
 
+    def reset(self, title: str, builder: Callable[[], QWidget], update: Callable[[QWidget], None]):
+        # Reuse this section for new content: update() refreshes an already
+        # built widget in place, otherwise builder() runs on first expand
+        self.toggle.setText(title)
+        self._builder = builder
+        if self._built:
+            update(self.content_area.widget())
+
+
+class RepoContent(QWidget):
+    """Commits + standup paragraph for one repo; set_repo() swaps the text in place."""
+
+    def __init__(self, r, parent=None):
+        super().__init__(parent)
+        v = QVBoxLayout(self)
+        self.commits_header = QLabel("<b>Commits</b>")
+        self.commits = rich_label("")
+        self.standup_header = QLabel("<b>Standup Summary</b>")
+        self.standup = rich_label("")
+        for w in (self.commits_header, self.commits, self.standup_header, self.standup):
+            v.addWidget(w)
+        self.set_repo(r)
+
+    def set_repo(self, r):
+        bullets = r.get("bullets") or []
+        # escape first so a stray '<' in a commit message isn't read as a tag
+        self.commits.setText(markdown_to_html(escape("\n".join(bullets), quote=False)) if bullets else "")
+        self.commits_header.setVisible(bool(bullets))
+        self.commits.setVisible(bool(bullets))
+
+        standup = r.get("standup_summary") or ""
+        # plain text from the model; escape so it renders verbatim
+        self.standup.setText(plain_to_html(standup))
+        self.standup_header.setVisible(bool(standup))
+        self.standup.setVisible(bool(standup))
+
 DARK_QSS = """
 QWidget { background: #11151a; color: #e6edf3; }
 QLineEdit, QTextEdit, QScrollArea { background: #0b0f14; color: #e6edf3; border: 1px solid #22303a; }
@@ -68,22 +197,106 @@ QPushButton { background: #f0f0f0; color: #111; border: 1px solid #ccc; padding:
 QComboBox, QDateEdit { background: #ffffff; border: 1px solid #ccc; }
 """
 
+_NODE_MARKERS = frozenset(("package.json", "pnpm-lock.yaml", "yarn.lock"))
+_TEST_MARKERS = frozenset(("tests", "test"))
+
 def repo_emoji(repo_path: Path) -> str:
-    # very lightweight heuristics
-    try:
-        files = {p.name for p in repo_path.iterdir()}
-    except Exception:
-        files = set()
+    return _repo_emoji_cached(os.fspath(repo_path))
+
 
-    # indicators
-    if "pyproject.toml" in files or any(str(repo_path).endswith(ext) for ext in (".py",)):
+@lru_cache(maxsize=512)
+def _repo_emoji_cached(repo_path: str) -> str:
+    # very lightweight heuristics; keyed on the path string, cleared on Refresh
+    if repo_path.endswith(".py"):
         return "🐍"
-    if "package.json" in files or "pnpm-lock.yaml" in files or "yarn.lock" in files:
+
+    # os.scandir only reads names; stop as soon as the top-priority marker shows up
+    node = tests = False
+    try:
+        with os.scandir(repo_path) as it:
+            for entry in it:
+                name = entry.name
+                if name == "pyproject.toml":
+                    return "🐍"
+                if name in _NODE_MARKERS:
+                    node = True
+                elif name in _TEST_MARKERS:
+                    tests = True
+    except OSError:
+        pass
+
+    if node:
         return "📦"
-    if "tests" in files or "test" in files:
+    if tests:
         return "🧪"
     return "📁"
 
+class SummaryCancelled(Exception):
+    pass
+
+class SummaryWorker(QObject):
+    """Runs the scan + LLM pipeline off the GUI thread and reports back via signals."""
+    progress = pyqtSignal(int, int, str)  # repos done, repos total, repo name
+    repo_done = pyqtSignal(object)        # one repo's summary dict, as soon as it is ready
+    finished = pyqtSignal(object)         # structured result dict
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    save_failed = pyqtSignal(str)         # Markdown export couldn't be written
+
+    def __init__(self, output_path=None, **scan_kwargs):
+        super().__init__()
+        self.output_path = output_path
+        self.scan_kwargs = scan_kwargs
+        self._cancel_requested = False
+
+    def cancel(self):
+        # checked between repos; the repo being summarized still finishes
+        self._cancel_requested = True
+
+    def _on_progress(self, done: int, total: int, repo_name: str):
+        self.progress.emit(done, total, repo_name)
+        if self._cancel_requested:
+            raise SummaryCancelled()
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            data = get_all_commits_across_repos_structured(
+                progress_callback=self._on_progress,
+                repo_callback=self.repo_done.emit,
+                **self.scan_kwargs
+            )
+        except SummaryCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(f"{type(e).__name__}: {e}")
+        else:
+            self.finished.emit(data)
+            # build + write the export here, not on the GUI thread
+            if self.output_path:
+                try:
+                    write_markdown_export(data, self.output_path)
+                except Exception as e:
+                    self.save_failed.emit(str(e))
+
+class ExportSignals(QObject):
+    save_failed = pyqtSignal(str)
+
+class ExportTask(QRunnable):
+    """Writes the Markdown export on a QThreadPool thread (re-renders have no SummaryWorker)."""
+
+    def __init__(self, data, output_path):
+        super().__init__()
+        self.data = data
+        self.output_path = output_path
+        self.signals = ExportSignals()
+
+    def run(self):
+        try:
+            write_markdown_export(self.data, self.output_path)
+        except Exception as e:
+            self.signals.save_failed.emit(str(e))
+
 class JournalApp(QWidget):
     def __init__(self):
         super().__init__()
@@ -140,19 +353,39 @@ class JournalApp(QWidget):
         self.select_output_button.clicked.connect(self.browse_output_file)
         layout.addWidget(self.select_output_button)
 
-        self.root_input = QLineEdit(os.path.expanduser("~/dev"))
+        self.root_input = QLineEdit(str(Path("~/dev").expanduser()))
         layout.addWidget(QLabel("Root folder to scan:"))
         layout.addWidget(self.root_input)
         self.root_input.editingFinished.connect(self.populate_repo_list)
 
         self.refresh_button = QPushButton("Refresh Repo List")
-        self.refresh_button.clicked.connect(self.populate_repo_list)
+        # an explicit refresh bypasses the on-disk repo list cache
+        self.refresh_button.clicked.connect(self.refresh_repo_list)
         layout.addWidget(self.refresh_button)
 
         self.run_button = QPushButton("Run Summary")
         self.run_button.clicked.connect(self.run_summary)
         layout.addWidget(self.run_button)
 
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel_summary)
+        self.cancel_button.hide()
+        layout.addWidget(self.cancel_button)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.hide()
+        layout.addWidget(self.progress_bar)
+
+        self._thread = None
+        self._worker = None
+        # repo sections by repo path, reused across runs instead of rebuilt
+        self._section_pool: dict[str, CollapsibleSection] = {}
+        # inputs + result of the last completed run, so an unchanged re-run
+        # just re-renders (see run_summary)
+        self._last_key = None
+        self._last_data = None
+        self._pending_key = None
+
                 # Results container (for collapsible sections)
         self.results_scroll = QScrollArea()
         self.results_scroll.setWidgetResizable(True)
@@ -182,6 +415,8 @@ class JournalApp(QWidget):
             self.setStyleSheet(LIGHT_QSS)
 
     def browse_output_file(self):
+        # only needed when the user actually browses
+        from PyQt5.QtWidgets import QFileDialog
         path, _ = QFileDialog.getSaveFileName(self, "Select Output File")
         if path:
             self.output_path.setText(path)
@@ -189,23 +424,43 @@ class JournalApp(QWidget):
     def toggle_date_range_visibility(self, text):
         self.date_range_container.setVisible(text.lower() == "custom")
 
-    def populate_repo_list(self):
+    def populate_repo_list(self, force: bool = False):
         root = self.root_input.text().strip() or "~/dev"
-        repos = find_git_repos(Path(os.path.expanduser(root)))
-
-        self.repo_list.clear()
-        for repo_path in repos:
-            item = QListWidgetItem(str(repo_path))
-            item.setCheckState(2)
-            self.repo_list.addItem(item)
+        repos = find_git_repos_cached(Path(root).expanduser(), force=force)
+
+        # nothing listens for per-row changes while the list is rebuilt
+        self.repo_list.blockSignals(True)
+        try:
+            with updates_suspended(self.repo_list):
+                self.repo_list.clear()
+                for repo_path in repos:
+                    item = QListWidgetItem(str(repo_path))
+                    item.setCheckState(Qt.Checked)
+                    self.repo_list.addItem(item)
+        finally:
+            self.repo_list.blockSignals(False)
             
+    def refresh_repo_list(self):
+        _repo_emoji_cached.cache_clear()
+        self.populate_repo_list(force=True)
+
     def clear_results(self):
         # remove existing collapsible sections
-        while self.results_layout.count():
-            item = self.results_layout.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.deleteLater()
+        pooled = set(self._section_pool.values())
+        with updates_suspended(self.results_host):
+            while self.results_layout.count():
+                item = self.results_layout.takeAt(0)
+                w = item.widget()
+                if w is None:
+                    continue
+                if w in pooled:
+                    # repo sections are kept for the next run (see _add_repo_section)
+                    w.hide()
+                else:
+                    w.deleteLater()
+            # drop the least recently shown sections once the pool gets large
+            while len(self._section_pool) > _SECTION_POOL_MAX:
+                self._section_pool.pop(next(iter(self._section_pool))).deleteLater()
 
     def run_summary(self):
     # inputs
@@ -230,7 +485,7 @@ class JournalApp(QWidget):
             selected_repos = [
                 Path(self.repo_list.item(i).text())
                 for i in range(self.repo_list.count())
-                if self.repo_list.item(i).checkState() == 2  # Qt.Checked
+                if self.repo_list.item(i).checkState() == Qt.Checked
             ]
             if not selected_repos:
                 # nothing checked; show a friendly message
@@ -242,9 +497,24 @@ class JournalApp(QWidget):
                 self.results_layout.addWidget(msg)
                 return
 
+        # same inputs and no new git activity since the last completed run:
+        # reuse its result instead of re-running git + the LLM
+        if selected_repos is None:
+            repos_for_key = [self.repo_list.item(i).text() for i in range(self.repo_list.count())]
+        else:
+            repos_for_key = [str(p) for p in selected_repos]
+        key = (mode, since_date, to_date, root, tuple(repos_for_key), _git_activity_stamp(repos_for_key))
+        # _on_summary_done files its data under _pending_key, so set it first
+        # on both paths
+        self._pending_key = key
+        if key == self._last_key and self._last_data is not None:
+            self._rerender(self._last_data, output_path if save_output else None)
+            return
+
         # get structured summaries (bullets + repo paragraph + team paragraph)
-        from journal.multi_repo_git_utils import get_all_commits_across_repos_structured
-        data = get_all_commits_across_repos_structured(
+        # on a worker thread so the window stays responsive
+        self._worker = SummaryWorker(
+            output_path=output_path if save_output else None,
             since_date=since_date,
             to_date=to_date,
             root=root,
@@ -252,77 +522,118 @@ class JournalApp(QWidget):
             mode=mode,
             selected_repos=selected_repos
         )
-
-        # render collapsible sections
+        self._thread = QThread(self)
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.run)
+        self._worker.progress.connect(self._on_summary_progress)
+        self._worker.repo_done.connect(self._add_repo_section)
+        self._worker.finished.connect(self._on_summary_done)
+        self._worker.failed.connect(self._on_summary_failed)
+        self._worker.cancelled.connect(self._on_summary_cancelled)
+        self._worker.save_failed.connect(self._on_save_failed)
+        for signal in (self._worker.finished, self._worker.failed, self._worker.cancelled):
+            signal.connect(self._thread.quit)
+        self._thread.finished.connect(self._on_thread_finished)
+
+        # repo sections are added as each one finishes
         self.clear_results()
-        export_lines = []  # build a markdown export alongside
+        self.run_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
+        self.cancel_button.show()
+        self.progress_bar.setRange(0, 0)  # busy until the first repo reports
+        self.progress_bar.show()
+        self._thread.start()
+
+    def cancel_summary(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            self.cancel_button.setEnabled(False)
+
+    def closeEvent(self, event):
+        # Destroying a QThread that is still running aborts the process, so
+        # stop the worker at its next repo boundary and wait for it
+        if self._thread is not None:
+            self.cancel_summary()
+            self._thread.quit()
+            self._thread.wait()
+        super().closeEvent(event)
+
+    def _on_summary_progress(self, done: int, total: int, repo_name: str):
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+        self.progress_bar.setFormat(f"%v/%m  {repo_name}")
+
+    def _on_summary_failed(self, message: str):
+        self._pending_key = None
+        err = QTextEdit()
+        err.setReadOnly(True)
+        err.setHtml(f"<span style='color:#c33'>Summary failed: {message}</span>")
+        self.results_layout.addWidget(err)
+
+    def _on_summary_cancelled(self):
+        self._pending_key = None
+        # keep whatever repos already finished
+        msg = QTextEdit()
+        msg.setReadOnly(True)
+        msg.setHtml("<i>Summary cancelled.</i>")
+        self.results_layout.addWidget(msg)
+
+    def _on_thread_finished(self):
+        self._worker.deleteLater()
+        self._thread.deleteLater()
+        self._worker = None
+        self._thread = None
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        self.run_button.setEnabled(True)
+
+    def _add_repo_section(self, r):
+        title = f"{repo_emoji(Path(r.get('path', '')))}  {r['repo_name']}"
+        key = r.get("path") or r["repo_name"]
+        # pop + reinsert keeps the pool in least-recently-used order
+        section = self._section_pool.pop(key, None)
+        if section is None:
+            section = CollapsibleSection(title, lambda r=r: RepoContent(r))
+        else:
+            section.reset(title, lambda r=r: RepoContent(r), lambda w, r=r: w.set_repo(r))
+        self._section_pool[key] = section
+        self.results_layout.addWidget(section)
+        section.show()
 
+    def _rerender(self, data, output_path):
+        self.clear_results()
         for r in data.get("repos", []):
-            title = f"{repo_emoji(Path(r.get('path', '')))}  {r['repo_name']}"
-
-            # content widget per repo
-            content = QWidget()
-            v = QVBoxLayout(content)
-
-            # bullets
-            bullets = r.get("bullets") or []
-            if bullets:
-                v.addWidget(QLabel("<b>Commits</b>"))
-                bullet_html = "<br>".join(
-                    # lightweight conversion of backticks to <code>
-                    re.sub(r'`([^`]*)`', r'<code>\\1</code>', b)
-                    for b in bullets
+            self._add_repo_section(r)
+        self._on_summary_done(data)
+        if output_path:
+            # off the GUI thread, like the export after a full run
+            task = ExportTask(data, output_path)
+            task.signals.save_failed.connect(self._on_save_failed)
+            QThreadPool.globalInstance().start(task)
+
+    def _on_summary_done(self, data):
+        self._last_key, self._last_data = self._pending_key, data
+        with updates_suspended(self.results_host):
+            # repo sections are already on screen (see _add_repo_section);
+            # the Markdown export is written by the worker
+            team_para = data.get("team_summary", "") or ""
+            if team_para:
+                team_section = CollapsibleSection(
+                    "🧠 Scrum Summary", lambda: rich_label(plain_to_html(team_para)), start_collapsed=False
                 )
-                bullets_view = QTextEdit()
-                bullets_view.setReadOnly(True)
-                bullets_view.setHtml(bullet_html)
-                bullets_view.setMinimumHeight(min(240, 24 * len(bullets) + 30))
-                v.addWidget(bullets_view)
-
-            # repo standup paragraph
-            if r.get("standup_summary"):
-                v.addWidget(QLabel("<b>Standup Summary</b>"))
-                para = QTextEdit()
-                para.setReadOnly(True)
-                # allow plain text from model; render as HTML safely
-                para.setHtml(r["standup_summary"])
-                v.addWidget(para)
-
-            section = CollapsibleSection(title, content)
-            self.results_layout.addWidget(section)
-
-            # build export
-            export_lines.append(f"### 📁 {r['repo_name']}")
-            export_lines.extend(bullets)
-            if r.get("standup_summary"):
-                export_lines.append(f"\n**Standup Summary:** {r['standup_summary']}\n")
-
-        # team scrum paragraph
-        team_para = data.get("team_summary", "") or ""
-        if team_para:
-            team_widget = QTextEdit()
-            team_widget.setReadOnly(True)
-            team_widget.setHtml(team_para)
-            team_section = CollapsibleSection("🧠 Scrum Summary", team_widget)
-            self.results_layout.addWidget(team_section)
-            export_lines.append("### 🧠 Scrum Summary")
-            export_lines.append(team_para)
-
-        # spacer so bottom has breathing room
-        spacer = QWidget()
-        spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.results_layout.addWidget(spacer)
-
-        # optional file export (Markdown)
-        if save_output and output_path:
-            try:
-                Path(output_path).write_text("\n\n".join(export_lines), encoding="utf-8")
-            except Exception as e:
-                # show a soft error inline
-                err = QTextEdit()
-                err.setReadOnly(True)
-                err.setHtml(f"<span style='color:#c33'>Failed to save output: {e}</span>")
-                self.results_layout.addWidget(err)
+                self.results_layout.addWidget(team_section)
+
+            # spacer so bottom has breathing room
+            spacer = QWidget()
+            spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            self.results_layout.addWidget(spacer)
+
+    def _on_save_failed(self, message: str):
+        # show a soft error inline
+        err = QTextEdit()
+        err.setReadOnly(True)
+        err.setHtml(f"<span style='color:#c33'>Failed to save output: {message}</span>")
+        self.results_layout.addWidget(err)
     
 if __name__ == '__main__':
         app = QApplication(sys.argv)
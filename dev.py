@@ -1,14 +1,41 @@
-import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import date
 import dev as ft
-import pandas as pd
 
 from journal.multi_repo_git_utils import (
+    DEFAULT_SCAN_WORKERS,
     find_git_repos,
     get_all_commits_across_repos_structured,
+    get_commit_stats_batch,
 )
 from journal.date_utils import resolve_since_date
+from journal.export import build_markdown_export
+
+_BULLET_HASH_RE = re.compile(r"`([0-9a-f]{6,40})`", re.IGNORECASE)
+
+
+def _repo_diff_stats(r: dict) -> list:
+    hashes = []
+    for b in r.get("bullets") or []:
+        m = _BULLET_HASH_RE.search(b)
+        if m:
+            hashes.append(m.group(1))
+    # one git process for all of this repo's commits
+    stats_by_hash = get_commit_stats_batch(Path(r.get("path", "")), hashes)
+    return [stats_by_hash[h] for h in hashes if h in stats_by_hash]
+
+
+def _attach_diff_stats(repos: list) -> None:
+    # Runs with the scan, off the render path; repos are independent, so
+    # their git processes can overlap
+    with_bullets = [r for r in repos if r.get("bullets")]
+    if not with_bullets:
+        return
+    with ThreadPoolExecutor(max_workers=min(DEFAULT_SCAN_WORKERS, len(with_bullets))) as pool:
+        for r, stats in zip(with_bullets, pool.map(_repo_diff_stats, with_bullets)):
+            r["diff_stats"] = stats
 
 
 def app(page: ft.Page):
@@ -18,7 +45,7 @@ def app(page: ft.Page):
     page.vertical_alignment = "start"
 
     # --- Controls ---
-    root = ft.TextField(label="Root folder", value=os.path.expanduser("~/dev"), expand=True)
+    root = ft.TextField(label="Root folder", value=str(Path("~/dev").expanduser()), expand=True)
     mode = ft.Dropdown(
         label="Mode",
         value="weekly",
@@ -41,7 +68,7 @@ def app(page: ft.Page):
     repos_list = ft.Dropdown(label="Repos (when not scanning all)", options=[], expand=True, multi_select=True)
 
     def refresh_repos(_=None):
-        repos = find_git_repos(Path(os.path.expanduser(root.value)))
+        repos = find_git_repos(Path(root.value).expanduser())
         repos_list.options = [ft.dropdown.Option(str(p)) for p in repos]
         repos_list.update()
 
@@ -86,19 +113,6 @@ def app(page: ft.Page):
     last_data = {"repos": [], "team_summary": ""}
 
     # helpers
-    def _collect_export_lines(data: dict) -> str:
-        lines = []
-        for r in data.get("repos", []):
-            lines.append(f"### 📁 {r['repo_name']}")
-            lines.extend(r.get("bullets") or [])
-            if r.get("standup_summary"):
-                lines.append(f"\n**Standup Summary:** {r['standup_summary']}\n")
-        team = data.get("team_summary") or ""
-        if team:
-            lines.append("### 🧠 Scrum Summary")
-            lines.append(team)
-        return "\n\n".join(lines)
-
     def _since_iso():
         if mode.value == "custom":
             s = since_dp.value or date.today()
@@ -119,18 +133,17 @@ def app(page: ft.Page):
         for r in data.get("repos", []):
             rows.append({"repo": r["repo_name"], "commits": len(r.get("bullets") or [])})
         if rows:
-            df = pd.DataFrame(rows).sort_values("commits", ascending=False)
+            rows.sort(key=lambda a: a["commits"], reverse=True)
             results.controls.append(ft.Text("📊 Commits per repository", weight=ft.FontWeight.BOLD))
             results.controls.append(ft.DataTable(
                 columns=[ft.DataColumn(ft.Text("Repo")), ft.DataColumn(ft.Text("Commits"))],
-                rows=[ft.DataRow(cells=[ft.DataCell(ft.Text(a["repo"])), ft.DataCell(ft.Text(str(a["commits"])))]) for a in df.to_dict("records")]
+                rows=[ft.DataRow(cells=[ft.DataCell(ft.Text(a["repo"])), ft.DataCell(ft.Text(str(a["commits"])))]) for a in rows]
             ))
 
         # per-repo expanders
         for r in data.get("repos", []):
             bullets = r.get("bullets") or []
             standup = r.get("standup_summary") or ""
-            repo_path = Path(r.get("path", ""))
 
             commit_md = "\n".join(bullets) if bullets else "_No commits in range_"
 
@@ -144,17 +157,8 @@ def app(page: ft.Page):
 
             # optional: diff stats table per commit
             if show_diff_stats.value and bullets:
-                import re as _re
-                from journal.multi_repo_git_utils import get_commit_stats
-                stat_rows = []
-                for b in bullets:
-                    m = _re.search(r"`([0-9a-f]{6,40})`", b, _re.IGNORECASE)
-                    if not m:
-                        continue
-                    chash = m.group(1)
-                    stats = get_commit_stats(repo_path, chash)
-                    if stats:
-                        stat_rows.append(stats)
+                # collected alongside the scan in on_run
+                stat_rows = r.get("diff_stats") or []
                 if stat_rows:
                     results.controls.append(ft.Divider())
                     results.controls.append(ft.Text(f"Diff stats — {r['repo_name']}", weight=ft.FontWeight.BOLD))
@@ -218,6 +222,8 @@ def app(page: ft.Page):
                 mode=mode.value,
                 selected_repos=sel_repos,
             )
+            if show_diff_stats.value:
+                _attach_diff_stats(data.get("repos", []))
         finally:
             run_btn.disabled = False
             run_btn.text = "Run"
@@ -230,7 +236,7 @@ def app(page: ft.Page):
     def on_export(e):
         if not last_data:
             return
-        md = _collect_export_lines(last_data)
+        md = build_markdown_export(last_data)
         # Save to a temp file and open folder, or just prompt download:
         # In Flet desktop, we can use FilePicker to save:
         def save_result(result: ft.FilePickerResultEvent):
@@ -1,29 +1,89 @@
 # journal/cache.py
 from __future__ import annotations
+import hashlib
 import json
+import os
+import threading
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+try:
+    import orjson  # optional, much faster (de)serialization
+except ImportError:
+    orjson = None
 
 DEFAULT_CACHE_PATH = Path.home() / ".devdiary_cache.json"
+# Repo discovery results live in their own file so GUI refreshes never race
+# the summarizer's read-modify-write of the commit cache
+DEFAULT_REPO_CACHE_PATH = Path.home() / ".devdiary_repos.json"
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+def _dumps(obj: Any) -> bytes:
+    # compact: the cache is rewritten often and only ever read by us
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# Last parsed contents per cache file, keyed on (mtime_ns, size), so the
+# per-commit lookups don't re-parse an unchanged file every time
+_parsed: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_parsed_lock = threading.Lock()
+
+def _file_stamp(path: Path) -> Tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
 def load_cache(path: Path = DEFAULT_CACHE_PATH) -> Dict[str, Any]:
-    if path.exists():
-        try:
-            return json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            # corrupted cache; start fresh
-            return {}
-    return {}
+    stamp = _file_stamp(path)
+    if stamp is None:
+        return {}
+    with _parsed_lock:
+        hit = _parsed.get(path)
+    if hit is not None and hit[0] == stamp:
+        # callers mutate the dict they get back; hand out a shallow copy
+        return dict(hit[1])
+    try:
+        cache = _loads(path.read_bytes())
+    except Exception:
+        # corrupted cache; start fresh
+        return {}
+    if isinstance(cache, dict):
+        with _parsed_lock:
+            _parsed[path] = (stamp, dict(cache))
+    return cache
 
 def save_cache(cache: Dict[str, Any], path: Path = DEFAULT_CACHE_PATH) -> None:
-    path.write_text(json.dumps(cache, ensure_ascii=False, indent=2), encoding="utf-8")
+    # write-then-rename so a crash mid-write never leaves a truncated cache;
+    # the pid keeps the CLI and desktop app from sharing a temp file
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(_dumps(cache))
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    stamp = _file_stamp(path)
+    if stamp is not None:
+        with _parsed_lock:
+            _parsed[path] = (stamp, dict(cache))
 
 def get_cached(hash_: str, cache: Dict[str, Any]) -> Any | None:
     return cache.get(hash_)
 
 def put_cached(hash_: str, value: Any, cache: Dict[str, Any]) -> None:
     cache[hash_] = value
-    
+
+# Bumped when a one-shot cleanup of existing cache files is needed
+CACHE_SCHEMA = 2
+_SCHEMA_KEY = "_schema"
+
 def purge_bad_entries(cache: dict) -> dict:
     to_delete = []
     for k, v in cache.items():
@@ -34,3 +94,57 @@ def purge_bad_entries(cache: dict) -> dict:
         cache.pop(k, None)
     return cache
 
+def migrate_cache(cache: dict) -> bool:
+    """Bring a loaded commit cache up to CACHE_SCHEMA; True if it changed and needs saving."""
+    if cache.get(_SCHEMA_KEY) == CACHE_SCHEMA:
+        return False
+    # Schema 1 caches may hold "(summary unavailable)" fallbacks; they're
+    # no longer written, so this scan only ever runs once per file
+    purge_bad_entries(cache)
+    cache[_SCHEMA_KEY] = CACHE_SCHEMA
+    return True
+
+def load_repo_cache(root: str, path: Path = DEFAULT_REPO_CACHE_PATH) -> Dict[str, Any] | None:
+    """Return {"stamp": ..., "repos": [...]} last saved for root, if any."""
+    entry = load_cache(path).get(root)
+    return entry if isinstance(entry, dict) else None
+
+def save_repo_cache(root: str, repos: list[str], stamp: float, path: Path = DEFAULT_REPO_CACHE_PATH) -> None:
+    cache = load_cache(path)
+    put_cached(root, {"stamp": stamp, "repos": repos}, cache)
+    try:
+        save_cache(cache, path)
+    except OSError:
+        pass  # best effort; the next lookup just rescans
+
+def _log_cache_file(repo: str, cache_dir: Path | None) -> Path:
+    if cache_dir is None:
+        from .logging_config import get_default_log_file
+        cache_dir = get_default_log_file().parent / "cache" / "gitlog"
+    return cache_dir / f"{hashlib.sha1(repo.encode('utf-8')).hexdigest()}.json"
+
+def load_log_cache(
+    repo: str, head: str, window: str, fmt: str, cache_dir: Path | None = None
+) -> str | None:
+    """Raw git log text saved for repo at commit head over window in format fmt, if any."""
+    entry = load_cache(_log_cache_file(repo, cache_dir))
+    if entry.get("head") != head or entry.get("format") != fmt:
+        return None
+    return entry.get("logs", {}).get(window)
+
+def save_log_cache(
+    repo: str, head: str, window: str, fmt: str, log: str, cache_dir: Path | None = None
+) -> None:
+    # One small file per repo holding only its current HEAD's windows, so the
+    # cache stays bounded: a new HEAD (or a new log format, which would make
+    # the stored text stale) replaces everything stored before
+    path = _log_cache_file(repo, cache_dir)
+    entry = load_cache(path)
+    if entry.get("head") != head or entry.get("format") != fmt:
+        entry = {"head": head, "format": fmt, "logs": {}}
+    entry["logs"][window] = log
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        save_cache(entry, path)
+    except OSError:
+        pass  # best effort; the next run just asks git again
@@ -1,4 +1,4 @@
-from journal.multi_repo_git_utils import get_all_commits_across_repos,get_today_date, get_past_days_date, get_first_day_of_month
+from journal.multi_repo_git_utils import get_today_date, get_past_days_date, get_first_day_of_month
 import click
 
 def resolve_since_date(mode: str) -> str:
@@ -0,0 +1,23 @@
+# journal/export.py
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict
+
+
+def build_markdown_export(data: Dict[str, Any]) -> str:
+    """Markdown report for a get_all_commits_across_repos_structured() result."""
+    lines = []
+    for r in data.get("repos", []):
+        lines.append(f"### 📁 {r['repo_name']}")
+        lines.extend(r.get("bullets") or [])
+        if r.get("standup_summary"):
+            lines.append(f"\n**Standup Summary:** {r['standup_summary']}\n")
+    team = data.get("team_summary") or ""
+    if team:
+        lines.append("### 🧠 Scrum Summary")
+        lines.append(team)
+    return "\n\n".join(lines)
+
+
+def write_markdown_export(data: Dict[str, Any], path: str | Path) -> None:
+    Path(path).write_text(build_markdown_export(data), encoding="utf-8")
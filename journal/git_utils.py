@@ -1,9 +1,10 @@
 # journal/git_utils.py
 import subprocess
-from datetime import datetime
+
+from .multi_repo_git_utils import get_today_date
 
 def get_today_git_summary():
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = get_today_date()
     cmd = [
         "git", "log",
         f"--since={today} 00:00",
@@ -5,12 +5,30 @@ Provides cross-platform logging setup with appropriate default log file location
 for Linux, macOS, and Windows.
 """
 
+import atexit
+import functools
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
+# Background thread that does the actual file/console writes; see setup_logging
+_listener: Optional[QueueListener] = None
 
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()  # flushes whatever is still queued
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+@functools.lru_cache(maxsize=1)
 def get_default_log_file() -> Path:
     """
     Get the default log file path based on the current platform.
@@ -20,6 +38,8 @@ def get_default_log_file() -> Path:
             - Linux: ~/.local/state/devdiary/devdiary.log
             - macOS: ~/Library/Logs/DevDiary/devdiary.log
             - Windows: %LOCALAPPDATA%\DevDiary\devdiary.log
+
+    The result (and the directory creation) is cached for the process.
     """
     if sys.platform == "darwin":  # macOS
         log_dir = Path.home() / "Library" / "Logs" / "DevDiary"
@@ -43,6 +63,10 @@ def setup_logging(
     """
     Set up logging with file and/or console handlers.
 
+    The root logger only gets a QueueHandler; the file and console handlers
+    run on a QueueListener thread, so threads that log never wait on disk
+    or terminal I/O or on each other's handler locks.
+
     Args:
         level: Logging level (e.g., logging.DEBUG, logging.INFO)
         log_file: Path to log file. If None, uses platform default.
@@ -59,8 +83,10 @@ def setup_logging(
     logger = logging.getLogger()
     logger.setLevel(level)
 
-    # Clear existing handlers to avoid duplicates
+    # Clear existing handlers (and a previous listener) to avoid duplicates
+    _stop_listener()
     logger.handlers.clear()
+    handlers = []
 
     # Create formatter
     formatter = logging.Formatter(
@@ -76,7 +102,7 @@ def setup_logging(
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
     except Exception as e:
         # If file logging fails, warn on console
         print(f"Warning: Could not set up file logging at {log_file}: {e}", file=sys.stderr)
@@ -86,7 +112,14 @@ def setup_logging(
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    if handlers:
+        global _listener
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
 
     return logger
 
@@ -1,14 +1,22 @@
-# journal/multi_repo_git_utils.py  (only the parts that change)
+# journal/multi_repo_git_utils.py
 from __future__ import annotations
+import hashlib
+import io
 import os
+import re
 import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 from pathlib import Path
 from datetime import datetime,timedelta
-from typing import List, Dict, Any, Optional
+from itertools import chain
+from typing import Callable, Iterator, List, Dict, Any, Optional
 
-from .summarize import summarize_repo_text_block, generate_team_scrum_paragraph  # NEW
+from .cache import load_log_cache, load_repo_cache, save_log_cache, save_repo_cache
 
-# ... (keep your existing EXCLUDED_PATTERNS, should_exclude, find_git_repos, get_commit_diff_stats)
+# .summarize (ollama + httpx) is imported lazily by the functions that need it
 
 # Patterns to exclude from file logs
 EXCLUDED_PATTERNS = [
@@ -16,90 +24,490 @@ EXCLUDED_PATTERNS = [
     ".git/", "env/", "site-packages", "/bin/", "/lib/", "dist-info"
 ]
 
-def get_today_date() -> str:
-    return datetime.now().strftime("%Y-%m-%d")
+# The date helpers take an optional `now` so a caller resolving several
+# dates for one scan can read the clock once and pass it to each; without
+# it they read the clock themselves, so the date is always current.
+def get_today_date(now: Optional[datetime] = None) -> str:
+    return (now or datetime.now()).strftime("%Y-%m-%d")
 
-def get_past_days_date(days: int) -> str:
-    return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+def get_past_days_date(days: int, now: Optional[datetime] = None) -> str:
+    return ((now or datetime.now()) - timedelta(days=days)).strftime("%Y-%m-%d")
 
-def get_first_day_of_month() -> str:
-    today = datetime.now()
-    return today.replace(day=1).strftime("%Y-%m-%d")
+def get_first_day_of_month(now: Optional[datetime] = None) -> str:
+    return (now or datetime.now()).replace(day=1).strftime("%Y-%m-%d")
+
+# All patterns in one alternation: a single C-level scan per path
+EXCLUDED_RE = re.compile("|".join(re.escape(p) for p in EXCLUDED_PATTERNS))
+
+# The same filter as git pathspecs, so git log never emits those files (or
+# commits touching only them). Non-glob pathspec wildcards match across "/",
+# so "*p*" is exactly a substring test, and icase mirrors the .lower() above.
+EXCLUDED_PATHSPECS = ["--", ".", *(f":(exclude,icase)*{p}*" for p in EXCLUDED_PATTERNS)]
 
 def should_exclude(line: str) -> bool:
-    normalized = Path(line.strip()).as_posix().lower()
-    return any(pattern in normalized for pattern in EXCLUDED_PATTERNS)
+    # git prints normalized relative paths, so separator + case folding is
+    # all the normalization needed (no Path object per file)
+    return EXCLUDED_RE.search(line.strip().replace("\\", "/").lower()) is not None
+
+# Dependency and tool-cache folders: huge, and never a repo of the user's
+# own, so the walk doesn't descend into them. Generic names like "build",
+# "dist" or "target" are deliberately absent: people do name repos that.
+_PRUNE_DIRS = frozenset({
+    "node_modules", ".venv", "venv", "__pycache__", ".tox", ".mypy_cache",
+})
+
+def _scandir_subdirs(path: str) -> Optional[list[str]]:
+    """Subdirectories worth walking, or None if path is itself a repo."""
+    # One scandir per directory; DirEntry.is_dir() uses the cached d_type, so
+    # unlike os.walk no stat() is needed and no file-name lists are built
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for e in it:
+                if e.name in _PRUNE_DIRS or not e.is_dir(follow_symlinks=False):
+                    continue
+                if e.name == ".git":
+                    return None  # Don't recurse into subfolders
+                subdirs.append(e.path)
+    except OSError:
+        pass
+    return subdirs
 
 def find_git_repos(root_path: Path) -> list[Path]:
-    git_repos = []
-    for dirpath, dirnames, _ in os.walk(root_path):
-        if ".git" in dirnames:
-            git_repos.append(Path(dirpath))
-            dirnames[:] = []  # Don't recurse into subfolders
+    git_repos: list[Path] = []
+    # Explicit stack instead of recursion: no recursion limit on deep trees,
+    # and no Python frame per directory. Children are pushed in reverse so
+    # repos come out in the same depth-first order as before.
+    stack = [os.fspath(root_path)]
+    while stack:
+        path = stack.pop()
+        subdirs = _scandir_subdirs(path)
+        if subdirs is None:
+            git_repos.append(Path(path))
+        else:
+            stack.extend(reversed(subdirs))
     return git_repos
 
-def get_commit_diff_stats(repo_path: Path, commit_hash: str) -> str:
-    """Return git diff --stat output for a commit."""
+def _repo_tree_stamp(root_path: Path) -> float:
+    # Adding/removing a repo at the top level or one level down bumps one of
+    # these mtimes; anything deeper needs a forced rescan
     try:
-        result = subprocess.run(
-            ["git", "show", "--stat", "--oneline", commit_hash],
-            cwd=repo_path,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        else:
-            return f"[Error fetching diff: {result.stderr.strip()}]"
-    except Exception as e:
-        return f"[Exception: {e}]"
-
-
-def get_commits_from_repo(repo_path: Path, since_date: str, to_date: str | None = None) -> str:
+        stamp = os.stat(root_path).st_mtime
+        with os.scandir(root_path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stamp = max(stamp, entry.stat(follow_symlinks=False).st_mtime)
+    except OSError:
+        return 0.0
+    return stamp
+
+def find_git_repos_cached(root_path: Path, force: bool = False) -> list[Path]:
+    """
+    find_git_repos() backed by an on-disk cache keyed by root path and the
+    mtimes of root and its direct subdirectories. force=True always rescans.
+    """
+    root = os.fspath(root_path)
+    stamp = _repo_tree_stamp(root_path)
+    if not force:
+        cached = load_repo_cache(root)
+        if cached and cached.get("stamp") == stamp:
+            return [Path(p) for p in cached.get("repos", [])]
+
+    repos = find_git_repos(root_path)
+    save_repo_cache(root, [str(p) for p in repos], stamp)
+    return repos
+
+_RENAME_BRACES_RE = re.compile(r"\{[^{}]* => ([^{}]*)\}")
+
+def _numstat_path(path: str) -> str:
+    # --numstat shows renames as "dir/{old => new}/f" or "old => new";
+    # --name-only (and so the exclude filter) only ever saw the new path
+    if " => " not in path:
+        return path
+    if "{" in path:
+        return _RENAME_BRACES_RE.sub(r"\1", path).replace("//", "/")
+    return path.split(" => ", 1)[1]
+
+def _read_head_sha(repo_path: Path) -> Optional[str]:
+    """Resolve HEAD to a commit id from the files in .git, without running git."""
+    git_dir = Path(repo_path) / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head or None  # detached HEAD
+        ref = head[5:]
+        try:
+            return (git_dir / ref).read_text().strip() or None
+        except FileNotFoundError:
+            pass
+        # ref only lives in packed-refs: "<sha> <refname>" lines
+        with open(git_dir / "packed-refs") as f:
+            for line in f:
+                sha, _, name = line.rstrip("\n").partition(" ")
+                if name == ref:
+                    return sha
+    except OSError:
+        pass
+    # worktrees/submodules (.git is a file), unborn branches, ...: don't memoize
+    return None
+
+# git log output per (repo, HEAD, window, exclude). git log without revision
+# arguments only walks from HEAD, so while HEAD doesn't move the result can't
+# change; long-lived callers (desktop app, Streamlit, watch loops) skip the
+# git process entirely on repeat scans.
+_LOG_MEMO_MAX = 256
+_log_memo: "OrderedDict[tuple, str]" = OrderedDict()
+_log_memo_lock = threading.Lock()
+
+# Format arguments of the git log call behind get_commits_from_repo
+_GIT_LOG_ARGS = ("--pretty=format:===COMMIT===%n%h %s", "--numstat", "--stat")
+# Bump when _write_filtered_block's output changes shape
+_LOG_BLOCK_VERSION = 1
+# Stored with every on-disk log cache entry: changing the git arguments,
+# the exclude pathspecs or the block layout invalidates old entries
+_LOG_CACHE_FORMAT = hashlib.sha1(
+    repr((_LOG_BLOCK_VERSION, _GIT_LOG_ARGS, EXCLUDED_PATHSPECS)).encode("utf-8")
+).hexdigest()[:12]
+
+def get_commits_from_repo(
+    repo_path: Path,
+    since_date: str,
+    to_date: str | None = None,
+    exclude: Callable[[str], bool] = should_exclude,
+) -> str:
+    head = _read_head_sha(repo_path)
+    if head is None:
+        return _git_log_blocks(repo_path, since_date, to_date, exclude)
+
+    repo = os.fspath(repo_path)
+    key = (repo, head, since_date, to_date, exclude)
+    with _log_memo_lock:
+        if key in _log_memo:
+            _log_memo.move_to_end(key)
+            return _log_memo[key]
+
+    # Across processes (e.g. a daily CLI run repeated) the default filter's
+    # results are also kept on disk; a custom exclude can't be keyed there
+    window = f"{since_date}|{to_date or ''}"
+    text = load_log_cache(repo, head, window, _LOG_CACHE_FORMAT) if exclude is should_exclude else None
+    if text is None:
+        text = _git_log_blocks(repo_path, since_date, to_date, exclude)
+        if exclude is should_exclude and not text.startswith("[Error reading repo"):
+            save_log_cache(repo, head, window, _LOG_CACHE_FORMAT, text)
+
+    if not text.startswith("[Error reading repo"):
+        with _log_memo_lock:
+            _log_memo[key] = text
+            while len(_log_memo) > _LOG_MEMO_MAX:
+                _log_memo.popitem(last=False)
+    return text
+
+def _git_log_blocks(
+    repo_path: Path,
+    since_date: str,
+    to_date: str | None,
+    exclude: Callable[[str], bool],
+) -> str:
     try:
         date_range = ["--since", f"{since_date} 00:00"]
         if to_date:
             date_range += ["--until", f"{to_date} 23:59"]
 
-        result = subprocess.run(
-            ["git", "log", *date_range, "--pretty=format:===COMMIT===%n%h %s", "--name-only"],
+        # One git process for the whole window: --numstat gives the file list
+        # and --stat a per-commit diffstat, so no extra process per commit is
+        # needed. Output is streamed and filtered one commit at a time instead
+        # of buffered and split as a whole.
+        # With the default filter git drops excluded files itself, so they
+        # are also missing from the diffstat (unlike a plain `git show
+        # --stat`); exclude() below then only acts as a safety net.
+        pathspecs = EXCLUDED_PATHSPECS if exclude is should_exclude else []
+        # kept blocks are written straight into one buffer, separated by
+        # COMMIT markers for summarizer splitting
+        out = io.StringIO()
+        sep = ""
+        with subprocess.Popen(
+            ["git", "log", *date_range, *_GIT_LOG_ARGS, *pathspecs],
             cwd=repo_path,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True
-        )
-
-        if result.returncode != 0 or not result.stdout.strip():
+        ) as proc:
+            commit_header = None
+            file_lines: List[str] = []
+            stat_lines: List[str] = []
+            for line in chain(proc.stdout, ["===COMMIT===\n"]):
+                line = line.rstrip("\n")
+                if line == "===COMMIT===":
+                    if _write_filtered_block(out, sep, commit_header, file_lines, stat_lines, exclude):
+                        sep = "\n\n===COMMIT===\n\n"
+                    commit_header = None
+                    file_lines, stat_lines = [], []
+                elif commit_header is None:
+                    commit_header = line.strip()
+                else:
+                    row = line.split("\t", 2)
+                    if len(row) == 3:
+                        file_lines.append(_numstat_path(row[2]))
+                    elif line.strip():
+                        stat_lines.append(line.rstrip())
+
+        if proc.returncode != 0:
             return ""
 
-        blocks = result.stdout.strip().split("===COMMIT===")
-        included_blocks = []
+        return out.getvalue()
 
-        for block in blocks:
-            lines = block.strip().split("\n")
-            if not lines:
-                continue
+    except Exception as e:
+        return f"[Error reading repo {repo_path}]: {e}"
 
-            commit_header = lines[0]
-            file_lines = lines[1:]
-            filtered_files = [f for f in file_lines if not should_exclude(f)]
+    return ""
+
+def _write_filtered_block(
+    out: io.StringIO,
+    sep: str,
+    commit_header: Optional[str],
+    file_lines: List[str],
+    stat_lines: List[str],
+    exclude: Callable[[str], bool],
+) -> bool:
+    """Write sep and the commit's block to out; False if it has no included files."""
+    if not commit_header:
+        return False
+    filtered_files = [f for f in file_lines if not exclude(f)]
+    if not filtered_files:
+        return False
+    out.write(sep)
+    out.write(commit_header)
+    out.write("\n")
+    out.write("\n".join(filtered_files))
+    out.write("\n\n")
+    # same shape as the `git show --stat --oneline` output used before
+    out.write(commit_header)
+    for line in stat_lines:
+        out.write("\n")
+        out.write(line)
+    return True
+
+def get_commit_numstats_from_repo(
+    repo_path: Path,
+    since_date: str,
+    to_date: str | None = None,
+    exclude: Callable[[str], bool] = should_exclude,
+    with_stats: bool = True,
+) -> list[tuple[str, str, int, int, int]]:
+    """
+    Return (hash, subject, files_changed, insertions, deletions) for each
+    commit in the range, parsed in one pass from a single
+    `git log --numstat` call instead of one git process per commit.
+
+    Commits whose files are all excluded are skipped; stats still cover every
+    file in the commit. With with_stats=False git only lists file names
+    (no per-file line diffs), so insertions/deletions are reported as 0.
+    Raises OSError if git can't be run.
+    """
+    date_range = ["--since", f"{since_date} 00:00"]
+    if to_date:
+        date_range += ["--until", f"{to_date} 23:59"]
+
+    # Raw bytes: only paths (for exclusion) and kept headers get decoded,
+    # and a stray non-UTF-8 message can't fail the whole repo
+    result = subprocess.run(
+        ["git", "log", *date_range, "--pretty=format:===COMMIT===%n%h %s",
+         "--numstat" if with_stats else "--name-only"],
+        cwd=repo_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
 
-            if filtered_files:
-                commit_hash = commit_header.split()[0]
-                diff = get_commit_diff_stats(repo_path, commit_hash)
-                included_blocks.append(
-                    commit_header + "\n" + "\n".join(filtered_files) + "\n\n" + diff
-                )
+    if result.returncode != 0:
+        return []
 
-        if included_blocks:
-            # IMPORTANT: we will keep COMMIT separators for summarizer splitting
-            return "\n\n===COMMIT===\n\n".join(included_blocks)
+    commits = []
 
-    except Exception as e:
-        return f"[Error reading repo {repo_path}]: {e}"
+    for block in result.stdout.split(b"===COMMIT==="):
+        lines = block.strip().split(b"\n")
+        parts = lines[0].decode("utf-8", "replace").split(maxsplit=1)
+        if not parts:
+            continue
 
-    return ""
+        files_changed = insertions = deletions = 0
+        keep = False
+        for line in lines[1:]:
+            if with_stats:
+                # "added<TAB>deleted<TAB>path"; binary files report "-" counts
+                row = line.split(b"\t", 2)
+                if len(row) != 3:
+                    continue
+                if row[0].isdigit():
+                    insertions += int(row[0])
+                if row[1].isdigit():
+                    deletions += int(row[1])
+                path = row[2]
+            elif line:
+                path = line
+            else:
+                continue
+            files_changed += 1
+            # renames are judged by their new path, as in _git_log_blocks
+            if not keep and not exclude(_numstat_path(path.decode("utf-8", "replace"))):
+                keep = True
+
+        if keep:
+            message = parts[1] if len(parts) > 1 else ""
+            commits.append((parts[0], message, files_changed, insertions, deletions))
+
+    return commits
+
+def get_commit_stats_batch(repo_path: Path, hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Look up date, author and numstat totals for specific commits using one
+    `git log --no-walk` process instead of one git call per hash. Returns a
+    dict keyed by the hashes as given; unknown hashes are simply absent.
+    """
+    if not hashes:
+        return {}
+
+    try:
+        result = subprocess.run(
+            ["git", "log", "--no-walk=unsorted", "--ignore-missing", "--numstat", "--date=short",
+             "--pretty=format:===COMMIT===%n%H%x00%ad%x00%an", *hashes],
+            cwd=repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except OSError:
+        return {}
+
+    if result.returncode != 0:
+        return {}
+
+    by_full_hash: Dict[str, Dict[str, Any]] = {}
+    for block in result.stdout.split(b"===COMMIT==="):
+        lines = block.strip().split(b"\n")
+        header = lines[0].decode("utf-8", "replace").split("\0")
+        if len(header) != 3:
+            continue
+        full_hash, date, author = header
+        files_changed = insertions = deletions = 0
+        for line in lines[1:]:
+            row = line.split(b"\t", 2)
+            if len(row) != 3:
+                continue
+            files_changed += 1
+            if row[0].isdigit():
+                insertions += int(row[0])
+            if row[1].isdigit():
+                deletions += int(row[1])
+        by_full_hash[full_hash] = {
+            "hash": full_hash,
+            "date": date,
+            "author": author,
+            "files_changed": files_changed,
+            "insertions": insertions,
+            "deletions": deletions,
+        }
+
+    # Index by every prefix length asked for (usually just one), so matching
+    # is a dict lookup per hash rather than a scan of all results
+    lengths = {len(h) for h in hashes}
+    by_prefix: Dict[str, Dict[str, Any]] = {}
+    for full_hash, entry in by_full_hash.items():
+        for n in lengths:
+            by_prefix.setdefault(full_hash[:n], entry)
+
+    stats: Dict[str, Dict[str, Any]] = {}
+    for h in hashes:
+        entry = by_prefix.get(h.lower())
+        if entry is not None:
+            stats[h] = entry
+    return stats
+
+def _scan_single_repo(repo_path: Path, since_date: str, to_date: str | None = None) -> tuple[Path, str]:
+    """Run the git log collection for one repo; used as a thread-pool task."""
+    return repo_path, get_commits_from_repo(repo_path, since_date, to_date=to_date)
+
+# git is subprocess/I/O-bound, so oversubscribing the cores is fine
+DEFAULT_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+def _configured_scan_workers() -> int:
+    # scanning.max_workers from the DevDiary config, so both scan paths
+    # (this one and core.scanner) honour the same knob
+    try:
+        from core.config import get_config
+        return get_config().scanning.max_workers or DEFAULT_SCAN_WORKERS
+    except Exception:
+        return DEFAULT_SCAN_WORKERS
+
+def _scan_repos_parallel(
+    repos: List[Path],
+    since_date: str,
+    to_date: Optional[str],
+    max_workers: Optional[int] = None,
+) -> List[tuple[Path, str]]:
+    """
+    Collect raw git logs for all repos concurrently.
+
+    git log is subprocess/I/O-bound, so threads overlap the waits. Each worker
+    returns its own (repo, log) pair; results are returned in the same order
+    as ``repos``. max_workers defaults to the configured scanning.max_workers.
+    """
+    if not repos:
+        return []
+    if max_workers is None:
+        max_workers = _configured_scan_workers()
+    workers = max(1, min(32, max_workers, len(repos)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_scan_single_repo, repo, since_date, to_date) for repo in repos]
+        return [f.result() for f in futures]
+
+# Repos summarized at once; each repo's commit batches already fan out
+# (summarize.BATCH_WORKERS), and a local Ollama only serves a few requests
+# in parallel, so this stays small (summarize caps the total in flight at
+# ollama.max_concurrent either way)
+DEFAULT_SUMMARY_WORKERS = 4
+
+def _summarize_repos_parallel(
+    scanned: List[tuple[Path, str]],
+    since_date: str,
+    to_date: Optional[str],
+    mode: str,
+    max_workers: int = DEFAULT_SUMMARY_WORKERS,
+    ordered: bool = True,
+) -> Iterator[tuple[Path, str, Dict[str, Any]]]:
+    """
+    Summarize every repo that has commits on a thread pool, yielding
+    (repo, raw_log, summary_obj) in ``scanned`` order, or as each repo
+    finishes when ``ordered`` is False. Repos without commits are skipped.
+    Closing the generator early (e.g. a caller's callback raised) cancels
+    the repos not yet started.
+    """
+    from .summarize import summarize_repo_text_block
+
+    with_commits = [(repo, raw_log) for repo, raw_log in scanned if raw_log]
+    if not with_commits:
+        return
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(with_commits))))
+    try:
+        futures = [
+            pool.submit(
+                summarize_repo_text_block,
+                repo_name=repo.name,
+                since_date=since_date,
+                to_date=to_date,
+                mode=mode,
+                full_repo_block_text=raw_log,
+            )
+            for repo, raw_log in with_commits
+        ]
+        if ordered:
+            for (repo, raw_log), future in zip(with_commits, futures):
+                yield repo, raw_log, future.result()
+        else:
+            by_future = dict(zip(futures, with_commits))
+            for future in as_completed(futures):
+                repo, raw_log = by_future[future]
+                yield repo, raw_log, future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
 
 def get_all_commits_across_repos(
     since_date: str,
@@ -109,39 +517,29 @@ def get_all_commits_across_repos(
     mode: str = "today",
     selected_repos: Optional[List[Path]] = None,
 ) -> str:
-    root_path = Path(os.path.expanduser(root))
+    root_path = Path(root).expanduser()
     repos = selected_repos if selected_repos is not None else find_git_repos(root_path)
 
     repo_outputs: List[str] = []
     repo_summaries: List[Dict[str, Any]] = []
 
-    for repo in repos:
-        raw_log = get_commits_from_repo(repo, since_date, to_date=to_date)
-        if not raw_log:
-            continue
-
-        if summarize_with_llm:
-            repo_name = repo.name
-            # existing classification creates bullets + team_snippets
-            # NEW: it now also returns a natural standup paragraph
-            summary_obj = summarize_repo_text_block(
-                repo_name=repo_name,
-                since_date=since_date,
-                to_date=to_date,
-                mode=mode,
-                full_repo_block_text=raw_log,
-            )
+    # git work fans out across repos, then so does the LLM work
+    scanned = _scan_repos_parallel(repos, since_date, to_date)
+    if summarize_with_llm:
+        # existing classification creates bullets + team_snippets
+        # NEW: it now also returns a natural standup paragraph
+        for repo, raw_log, summary_obj in _summarize_repos_parallel(scanned, since_date, to_date, mode):
             repo_summaries.append(summary_obj)
 
             # build pretty section
-            section = [f"### 📁 {repo_name}"]
+            section = [f"### 📁 {repo.name}"]
             section += summary_obj["bullets"]
             if summary_obj.get("standup_summary"):
                 section.append(f"\n**Standup Summary:** {summary_obj['standup_summary']}")
             repo_outputs.append("\n".join(section))
-        else:
-            # raw passthrough
-            repo_outputs.append(f"### 📁 {repo.name}\n{raw_log}")
+    else:
+        # raw passthrough
+        repo_outputs.extend(f"### 📁 {repo.name}\n{raw_log}" for repo, raw_log in scanned if raw_log)
 
     if not repo_outputs:
         return "No commits found in the selected period."
@@ -149,13 +547,17 @@ def get_all_commits_across_repos(
     final = []
     final.extend(repo_outputs)
 
-    # NEW: cohesive team-level scrum paragraph
-    team_para = generate_team_scrum_paragraph(
-        repo_summaries=repo_summaries,
-        since_date=since_date,
-        to_date=to_date,
-        mode=mode,
-    )
+    # NEW: cohesive team-level scrum paragraph (only LLM runs collect summaries)
+    team_para = ""
+    if repo_summaries:
+        from .summarize import generate_team_scrum_paragraph
+
+        team_para = generate_team_scrum_paragraph(
+            repo_summaries=repo_summaries,
+            since_date=since_date,
+            to_date=to_date,
+            mode=mode,
+        )
     if team_para:
         final.append("\n### 🧠 Scrum Summary\n" + team_para)
 
@@ -169,35 +571,55 @@ def get_all_commits_across_repos_structured(
     summarize_with_llm: bool = True,
     mode: str = "today",
     selected_repos: Optional[List[Path]] = None,
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    repo_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> Dict[str, Any]:
-    root_path = Path(os.path.expanduser(root))
+    """
+    max_workers caps the git log threads (default: scanning.max_workers).
+    progress_callback, if given, is called as (repos_done, repos_total, repo_name)
+    after each repo with commits in range is summarized; repo_callback gets each repo's summary dict
+    as soon as it is ready, so callers can show results before the team
+    paragraph is done. Both run on the calling thread.
+    """
+    from .summarize import generate_team_scrum_paragraph
+
+    root_path = Path(root).expanduser()
     repos = selected_repos if selected_repos is not None else find_git_repos(root_path)
 
-    repo_summaries: List[Dict[str, Any]] = []
-    for repo in repos:
-        raw_log = get_commits_from_repo(repo, since_date, to_date=to_date)
-        if not raw_log:
-            continue
-
-        if summarize_with_llm:
-            summary_obj = summarize_repo_text_block(
-                repo_name=repo.name,
-                since_date=since_date,
-                to_date=to_date,
-                mode=mode,
-                full_repo_block_text=raw_log,
-            )
-            summary_obj["path"] = str(repo)
-            repo_summaries.append(summary_obj)
-        else:
-            # fallback minimal shape
-            repo_summaries.append({
+    # Stage 1: git log fan-out across repos
+    scanned = _scan_repos_parallel(repos, since_date, to_date, max_workers=max_workers)
+
+    # Stage 2: LLM summarization, also fanned out across repos (the on-disk
+    # summary cache is lock-protected). Callbacks fire as each repo finishes;
+    # the returned list is put back in repo order below
+    if summarize_with_llm:
+        summarized = _summarize_repos_parallel(scanned, since_date, to_date, mode, ordered=False)
+    else:
+        # fallback minimal shape
+        summarized = (
+            (repo, raw_log, {
                 "repo_name": repo.name,
-                "path": str(repo),
                 "bullets": [raw_log],
                 "team_snippets": [],
                 "standup_summary": "",
             })
+            for repo, raw_log in scanned if raw_log
+        )
+
+    # progress counts the repos that actually have commits to summarize
+    total = sum(1 for _, raw_log in scanned if raw_log)
+    repo_summaries: List[Dict[str, Any]] = []
+    with closing(summarized):
+        for done, (repo, raw_log, summary_obj) in enumerate(summarized, 1):
+            summary_obj["path"] = str(repo)
+            repo_summaries.append(summary_obj)
+            if repo_callback:
+                repo_callback(summary_obj)
+            if progress_callback:
+                progress_callback(done, total, repo.name)
+    position = {str(repo): i for i, (repo, _) in enumerate(scanned)}
+    repo_summaries.sort(key=lambda r: position[r["path"]])
 
     team_para = generate_team_scrum_paragraph(
         repo_summaries=repo_summaries,
@@ -1,15 +1,27 @@
 # journal/summarize.py
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
-from typing import Dict, Any, Optional, List
-
-from ollama import Client
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Any, Optional, List
+
+from ollama import AsyncClient, Client
+
+try:
+    import orjson  # optional, much faster parsing of long model replies
+except ImportError:
+    orjson = None
 from .cache import (
+    DEFAULT_CACHE_PATH,
     load_cache,
-    purge_bad_entries,
+    migrate_cache,
     save_cache,
     get_cached,
     put_cached,
@@ -19,6 +31,50 @@ logger = logging.getLogger(__name__)
 
 # Global client instance
 _client: Optional[Client] = None
+_client_lock = threading.Lock()
+
+# Bump whenever the commit classification prompt changes; persistent
+# summary caches key on this so stale summaries are invalidated.
+PROMPT_VERSION = "1"
+
+# Serializes read-modify-write of the JSON summary cache so commits can be
+# summarized from several threads without clobbering each other's entries
+_cache_lock = threading.Lock()
+
+# Commits per batched classification prompt (used when the config can't be
+# read), the prompt size (in characters of raw commit text) a batch may
+# reach, and how many batches are in flight at once per repo. A local Ollama
+# only serves a handful of requests in parallel, so the total across repos
+# is further capped by _ollama_slots().
+BATCH_SIZE = 8
+BATCH_CHAR_BUDGET = 12_000
+BATCH_WORKERS = 4
+
+def _configured_batch_size() -> int:
+    # ollama.batch_size from the DevDiary config, as core.summarizer uses
+    try:
+        from core.config import get_config
+        return get_config().ollama.batch_size
+    except Exception:
+        return BATCH_SIZE
+
+@lru_cache(maxsize=1)
+def _ollama_slots() -> threading.BoundedSemaphore:
+    # Caps blocking Ollama requests in flight across every thread in the
+    # process: repo workers x BATCH_WORKERS would otherwise reach 16
+    try:
+        from core.config import get_config
+        limit = get_config().ollama.max_concurrent
+    except Exception:
+        limit = BATCH_WORKERS
+    return threading.BoundedSemaphore(max(1, limit))
+
+def _client_chat(client: Client, **kwargs: Any) -> Any:
+    with _ollama_slots():
+        return client.chat(**kwargs)
+
+# Process-wide hit/miss counters for the summary cache (for UI telemetry)
+CACHE_STATS: Counter = Counter()
 
 
 def get_ollama_client() -> Client:
@@ -36,12 +92,20 @@ def get_ollama_client() -> Client:
         RuntimeError: If Ollama is not accessible or llama3 model is not available,
                      with detailed setup instructions
     """
-    global _client
-
     if _client is not None:
         logger.debug("Reusing existing Ollama client instance")
         return _client
 
+    # Only one thread validates; the others wait and reuse its client
+    with _client_lock:
+        if _client is not None:
+            return _client
+        return _create_ollama_client()
+
+
+def _create_ollama_client() -> Client:
+    global _client
+
     logger.info("Initializing Ollama client")
 
     try:
@@ -104,6 +168,24 @@ def get_ollama_client() -> Client:
         raise RuntimeError(error_msg) from e
 
 
+@asynccontextmanager
+async def open_async_ollama_client() -> AsyncIterator[AsyncClient]:
+    """
+    Yield an AsyncClient whose connection pool is closed when the block exits.
+
+    Open one per event loop run (an httpx async pool can't be shared across
+    loops) and pass it to the *_async helpers so they share its connections.
+    """
+    client = AsyncClient()
+    try:
+        yield client
+    finally:
+        # ollama keeps its httpx.AsyncClient in _client; older releases have
+        # no public close()
+        inner = getattr(client, "_client", None)
+        if inner is not None:
+            await inner.aclose()
+
 def _chat(system_prompt: str, user_prompt: str, json_mode: bool = False) -> str:
     """
     Send a chat request to the Ollama LLM.
@@ -130,7 +212,7 @@ def _chat(system_prompt: str, user_prompt: str, json_mode: bool = False) -> str:
         logger.debug("Requesting JSON-formatted response from LLM")
 
     logger.debug(f"Sending chat request to Ollama (json_mode={json_mode})")
-    resp = client.chat(**kwargs)
+    resp = _client_chat(client, **kwargs)
     response_content = resp["message"]["content"].strip()
     logger.debug(f"Received response from Ollama ({len(response_content)} chars)")
 
@@ -159,10 +241,14 @@ def _time_window_phrase(mode: str, since_date: str, to_date: Optional[str]) -> s
 # Robust JSON parsing helpers
 # -------------------------
 _JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+_FENCE_OPEN_RE = re.compile(r"^```(?:json)?\s*", re.IGNORECASE)
+_FENCE_CLOSE_RE = re.compile(r"\s*```$")
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_COMMIT_HASH_RE = re.compile(r"^([0-9a-f]{6,40})\b")
 
 def _strip_code_fences(text: str) -> str:
-    text = re.sub(r"^```(?:json)?\s*", "", text.strip(), flags=re.IGNORECASE)
-    text = re.sub(r"\s*```$", "", text.strip())
+    text = _FENCE_OPEN_RE.sub("", text.strip())
+    text = _FENCE_CLOSE_RE.sub("", text.strip())
     return text.strip()
 
 def _normalize_quotes(text: str) -> str:
@@ -178,10 +264,12 @@ def _extract_json_block(text: str) -> Optional[str]:
         return None
     return text[m.start():m.end()]
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 def _try_parse_json(text: str) -> Optional[Dict[str, Any]]:
     # 1) direct
     try:
-        return json.loads(text)
+        return _json_loads(text)
     except Exception:
         pass
 
@@ -189,12 +277,12 @@ def _try_parse_json(text: str) -> Optional[Dict[str, Any]]:
     block = _extract_json_block(text)
     if block:
         try:
-            return json.loads(block)
+            return _json_loads(block)
         except Exception:
             # 3) remove trailing commas before } or ]
-            cleaned = re.sub(r",\s*([}\]])", r"\1", block)
+            cleaned = _TRAILING_COMMA_RE.sub(r"\1", block)
             try:
-                return json.loads(cleaned)
+                return _json_loads(cleaned)
             except Exception:
                 return None
     return None
@@ -206,7 +294,7 @@ def _try_parse_json(text: str) -> Optional[Dict[str, Any]]:
 def _extract_commit_hash(block: str) -> Optional[str]:
     # First line of each block is "abcd123 Message..."
     first = block.strip().splitlines()[0] if block.strip() else ""
-    m = re.match(r"^([0-9a-f]{6,40})\b", first)
+    m = _COMMIT_HASH_RE.match(first)
     return m.group(1) if m else None
 
 def _extract_commit_message(block: str) -> str:
@@ -240,6 +328,108 @@ def _heuristic_work_type(msg: str) -> str:
 # -------------------------
 # Main per-commit classifier/summarizer (with cache)
 # -------------------------
+def _store_cached(commit_hash: str, value: Dict[str, Any], cache_path) -> None:
+    # Re-read under the lock so entries written by other threads survive
+    with _cache_lock:
+        cache = load_cache(cache_path)
+        put_cached(commit_hash, value, cache)
+        save_cache(cache, cache_path)
+
+def _store_cached_many(values: Dict[str, Dict[str, Any]], cache_path) -> None:
+    # One read-modify-write for a whole batch instead of one per commit
+    with _cache_lock:
+        cache = load_cache(cache_path)
+        cache.update(values)
+        save_cache(cache, cache_path)
+
+def _commit_prompts(commit_hash: str, repo_name: str, commit_block: str, time_window: str) -> tuple[str, str]:
+    system_prompt = f"""
+        You are a developer journal assistant. Convert a single Git commit (header, files, and a --stat diff)
+        into a JSON object with: commit_hash, work_type, bullet, team_snippet.
+
+        Rules:
+        - work_type MUST be one of: feature, bugfix, refactor, docs, test, chore, perf, build, ci, other.
+        - bullet MUST be a single bullet string like:
+        - `abc123`: Clear one-sentence summary (key files)
+        Include the work type at the start in square brackets, e.g. "- [feature] `abc123`: ...".
+        - team_snippet MUST be a short phrase that can be aggregated across repos (no trailing punctuation).
+        - Use this time window phrase in your reasoning if needed: "{time_window}".
+
+        Respond with ONLY JSON (no prose), no code fences.
+        """.strip()
+
+    # We pass the raw block (header + files + optional --stat) as-is
+    user_prompt = f"""
+        Repository: {repo_name}
+        Time Window: {time_window}
+
+        Raw Commit Block:
+        {commit_block}
+
+        Return JSON ONLY with:
+        {{
+        "commit_hash": "{commit_hash}",
+        "work_type": "feature|bugfix|refactor|docs|test|chore|perf|build|ci|other",
+        "bullet": "- [<work_type>] `{commit_hash}`: <one-sentence summary> (files)",
+        "team_snippet": "<short phrase for cross-repo summary>"
+        }}
+        """.strip()
+    return system_prompt, user_prompt
+
+def _lookup_cached_commit(commit_hash: str, cache_path) -> Optional[Dict[str, Any]]:
+    with _cache_lock:
+        cache = load_cache(cache_path)
+        if migrate_cache(cache):
+            save_cache(cache, cache_path)
+
+    cached = get_cached(commit_hash, cache)
+    if cached:
+        CACHE_STATS["hit"] += 1
+        logger.debug(f"Using cached summary for commit {commit_hash}")
+        return cached
+    CACHE_STATS["miss"] += 1
+    return None
+
+def _normalize_commit_data(data: Optional[Dict[str, Any]], commit_hash: str, commit_msg: str) -> Dict[str, Any]:
+    # Final deterministic fallback (heuristics)
+    if not data:
+        logger.warning(f"LLM response parsing failed for commit {commit_hash}, using heuristic fallback")
+        wt = _heuristic_work_type(commit_msg)
+        data = {
+            "commit_hash": commit_hash,
+            "work_type": wt,
+            "bullet": f"- [{wt}] `{commit_hash}`: {commit_msg or 'Updated files'}",
+            "team_snippet": (commit_msg or "updates")[:60].rstrip("."),
+        }
+    else:
+        logger.debug(f"Successfully classified commit {commit_hash} as {data.get('work_type', 'unknown')}")
+
+    # sanitize & defaults
+    if "commit_hash" not in data or not data["commit_hash"]:
+        data["commit_hash"] = commit_hash
+    if "work_type" not in data or not data["work_type"]:
+        data["work_type"] = _heuristic_work_type(commit_msg)
+    if "bullet" not in data or not data["bullet"]:
+        data["bullet"] = f"- [{data['work_type']}] `{commit_hash}`: {commit_msg or 'Updated files'}"
+    if "team_snippet" not in data or not data["team_snippet"]:
+        data["team_snippet"] = (commit_msg or "updates")[:60].rstrip(".")
+    return data
+
+def _fallback_commit_data(e: Exception, commit_hash: str, commit_msg: str) -> Dict[str, Any]:
+    # No traceback at error level: when Ollama drops mid-scan this fires for
+    # every remaining commit. It's still there with debug logging enabled.
+    logger.error(f"Error classifying commit {commit_hash}: {type(e).__name__}: {str(e)[:200]}")
+    logger.debug(f"Traceback for commit {commit_hash}", exc_info=e)
+    fallback = {
+        "commit_hash": commit_hash,
+        "work_type": _heuristic_work_type(commit_msg),
+        "bullet": f"- `[{_heuristic_work_type(commit_msg)}] {commit_hash}`: (summary unavailable) {str(e)}",
+        "team_snippet": "updates",
+    }
+    # Not cached: the next run should retry the LLM for this commit
+    logger.debug(f"Using fallback summary for commit {commit_hash}")
+    return fallback
+
 def classify_and_summarize_commit(
     commit_block: str,
     repo_name: str,
@@ -247,8 +437,12 @@ def classify_and_summarize_commit(
     to_date: Optional[str],
     mode: str,
     cache_path=None,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
     """
+    use_cache=False skips the JSON cache (it is keyed by commit hash only),
+    for callers with their own model/prompt-aware cache.
+
     Returns dict:
       {
         "commit_hash": "...",
@@ -262,20 +456,107 @@ def classify_and_summarize_commit(
 
     logger.debug(f"Classifying commit {commit_hash} in {repo_name}")
 
-    cache = load_cache() if cache_path is None else load_cache(cache_path)
-    # auto-heal bad cached entries like "(summary unavailable) ..."
-    cache = purge_bad_entries(cache)
-    save_cache(cache)
+    cache_path = DEFAULT_CACHE_PATH if cache_path is None else cache_path
+    cached = _lookup_cached_commit(commit_hash, cache_path) if use_cache else None
+    if cached:
+        return cached
 
-    cached = get_cached(commit_hash, cache)
+    time_window = _time_window_phrase(mode, since_date, to_date)
+    system_prompt, user_prompt = _commit_prompts(commit_hash, repo_name, commit_block, time_window)
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user",  "content": user_prompt},
+    ]
+
+    # 1) Ask in JSON mode
+    try:
+        logger.debug(f"Requesting LLM summary for commit {commit_hash} (JSON mode)")
+        client = get_ollama_client()
+        resp = _client_chat(client, model="llama3", messages=messages, format="json")  # ask for strict JSON
+        data = _try_parse_json(resp["message"]["content"])
+
+        # 2) Retry once without format if parsing failed
+        if not data:
+            logger.warning(f"JSON parsing failed for commit {commit_hash}, retrying without format constraint")
+            resp2 = _client_chat(client, model="llama3", messages=messages)
+            data = _try_parse_json(resp2["message"]["content"])
+
+        # 3) Fallback + sanitize
+        data = _normalize_commit_data(data, commit_hash, commit_msg)
+
+        # cache only normalized dicts
+        if use_cache:
+            _store_cached(commit_hash, data, cache_path)
+            logger.debug(f"Cached summary for commit {commit_hash}")
+        return data
+
+    except Exception as e:
+        return _fallback_commit_data(e, commit_hash, commit_msg)
+
+async def classify_and_summarize_commit_async(
+    commit_block: str,
+    repo_name: str,
+    since_date: str,
+    to_date: Optional[str],
+    mode: str,
+    cache_path=None,
+    client: Optional[AsyncClient] = None,
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Async twin of classify_and_summarize_commit built on ollama.AsyncClient,
+    so many commits can be in flight at once from one event loop. Pass a
+    shared `client` (created inside the running loop) to reuse connections;
+    without one a client is opened and closed for this call.
+    use_cache behaves as in classify_and_summarize_commit.
+    """
+    if client is None:
+        async with open_async_ollama_client() as client:
+            return await classify_and_summarize_commit_async(
+                commit_block, repo_name, since_date, to_date, mode,
+                cache_path=cache_path, client=client, use_cache=use_cache,
+            )
+
+    commit_hash = _extract_commit_hash(commit_block) or "unknown"
+    commit_msg  = _extract_commit_message(commit_block)
+
+    logger.debug(f"Classifying commit {commit_hash} in {repo_name} (async)")
+
+    cache_path = DEFAULT_CACHE_PATH if cache_path is None else cache_path
+    cached = await asyncio.to_thread(_lookup_cached_commit, commit_hash, cache_path) if use_cache else None
     if cached:
-        logger.debug(f"Using cached summary for commit {commit_hash}")
         return cached
 
     time_window = _time_window_phrase(mode, since_date, to_date)
+    system_prompt, user_prompt = _commit_prompts(commit_hash, repo_name, commit_block, time_window)
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user",  "content": user_prompt},
+    ]
+
+    try:
+        resp = await client.chat(model="llama3", messages=messages, format="json")
+        data = _try_parse_json(resp["message"]["content"])
+
+        if not data:
+            logger.warning(f"JSON parsing failed for commit {commit_hash}, retrying without format constraint")
+            resp2 = await client.chat(model="llama3", messages=messages)
+            data = _try_parse_json(resp2["message"]["content"])
+
+        data = _normalize_commit_data(data, commit_hash, commit_msg)
+        if use_cache:
+            await asyncio.to_thread(_store_cached, commit_hash, data, cache_path)
+            logger.debug(f"Cached summary for commit {commit_hash}")
+        return data
+
+    except Exception as e:
+        return _fallback_commit_data(e, commit_hash, commit_msg)
 
+def _batch_prompts(
+    commit_hashes: list[str], repo_name: str, commit_blocks: list[str], time_window: str
+) -> tuple[str, str]:
     system_prompt = f"""
-        You are a developer journal assistant. Convert a single Git commit (header, files, and a --stat diff)
+        You are a developer journal assistant. Convert EACH of the numbered Git commits you are given
         into a JSON object with: commit_hash, work_type, bullet, team_snippet.
 
         Rules:
@@ -285,95 +566,230 @@ def classify_and_summarize_commit(
         Include the work type at the start in square brackets, e.g. "- [feature] `abc123`: ...".
         - team_snippet MUST be a short phrase that can be aggregated across repos (no trailing punctuation).
         - Use this time window phrase in your reasoning if needed: "{time_window}".
+        - Return exactly one object per commit, in the same order as the input.
 
         Respond with ONLY JSON (no prose), no code fences.
         """.strip()
 
-    # We pass the raw block (header + files + optional --stat) as-is
+    numbered = "\n".join(f"[{i}] {block}" for i, block in enumerate(commit_blocks, 1))
     user_prompt = f"""
         Repository: {repo_name}
         Time Window: {time_window}
 
-        Raw Commit Block:
-        {commit_block}
+        Commits:
+        {numbered}
 
-        Return JSON ONLY with:
+        Return JSON ONLY, a list aligned by index:
         {{
-        "commit_hash": "{commit_hash}",
-        "work_type": "feature|bugfix|refactor|docs|test|chore|perf|build|ci|other",
-        "bullet": "- [<work_type>] `{commit_hash}`: <one-sentence summary> (files)",
-        "team_snippet": "<short phrase for cross-repo summary>"
+        "commits": [
+            {{
+            "commit_hash": "{commit_hashes[0]}",
+            "work_type": "feature|bugfix|refactor|docs|test|chore|perf|build|ci|other",
+            "bullet": "- [<work_type>] `{commit_hashes[0]}`: <one-sentence summary> (files)",
+            "team_snippet": "<short phrase for cross-repo summary>"
+            }}
+        ]
         }}
         """.strip()
+    return system_prompt, user_prompt
 
-    # 1) Ask in JSON mode
-    try:
-        logger.debug(f"Requesting LLM summary for commit {commit_hash} (JSON mode)")
-        client = get_ollama_client()
-        resp = client.chat(
-            model="llama3",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user",  "content": user_prompt},
-            ],
-            format="json",  # ask for strict JSON
-        )
-        content = resp["message"]["content"]
-        data = _try_parse_json(content)
+async def classify_and_summarize_commits_batch_async(
+    commit_blocks: list[str],
+    repo_name: str,
+    since_date: str,
+    to_date: Optional[str],
+    mode: str,
+    client: Optional[AsyncClient] = None,
+) -> Optional[list[Dict[str, Any]]]:
+    """
+    Classify several commits with ONE LLM request, so the shared instructions
+    are only sent (and prefilled) once per batch instead of once per commit.
 
-        # 2) Retry once without format if parsing failed
-        if not data:
-            logger.warning(f"JSON parsing failed for commit {commit_hash}, retrying without format constraint")
-            resp2 = client.chat(
-                model="llama3",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user",  "content": user_prompt},
-                ],
+    Returns one normalized dict per block, in input order, or None if the
+    reply can't be aligned with the input; callers should then fall back to
+    classify_and_summarize_commit_async per commit. Results are not written
+    to the journal cache. Without a `client` one is opened for this call.
+    """
+    if not commit_blocks:
+        return []
+    if client is None:
+        async with open_async_ollama_client() as client:
+            return await classify_and_summarize_commits_batch_async(
+                commit_blocks, repo_name, since_date, to_date, mode, client=client,
             )
-            data = _try_parse_json(resp2["message"]["content"])
 
-        # 3) Final deterministic fallback (heuristics)
-        if not data:
-            logger.warning(f"LLM response parsing failed for commit {commit_hash}, using heuristic fallback")
-            wt = _heuristic_work_type(commit_msg)
-            data = {
-                "commit_hash": commit_hash,
-                "work_type": wt,
-                "bullet": f"- [{wt}] `{commit_hash}`: {commit_msg or 'Updated files'}",
-                "team_snippet": (commit_msg or "updates")[:60].rstrip("."),
-            }
-        else:
-            logger.debug(f"Successfully classified commit {commit_hash} as {data.get('work_type', 'unknown')}")
-
-        # sanitize & defaults
-        if "commit_hash" not in data or not data["commit_hash"]:
-            data["commit_hash"] = commit_hash
-        if "work_type" not in data or not data["work_type"]:
-            data["work_type"] = _heuristic_work_type(commit_msg)
-        if "bullet" not in data or not data["bullet"]:
-            data["bullet"] = f"- [{data['work_type']}] `{commit_hash}`: {commit_msg or 'Updated files'}"
-        if "team_snippet" not in data or not data["team_snippet"]:
-            data["team_snippet"] = (commit_msg or "updates")[:60].rstrip(".")
+    hashes = [_extract_commit_hash(b) or "unknown" for b in commit_blocks]
+    msgs = [_extract_commit_message(b) for b in commit_blocks]
 
-        # cache only normalized dicts
-        put_cached(commit_hash, data, cache)
-        save_cache(cache)
-        logger.debug(f"Cached summary for commit {commit_hash}")
-        return data
+    logger.debug(f"Classifying {len(commit_blocks)} commits in {repo_name} (batched)")
 
+    time_window = _time_window_phrase(mode, since_date, to_date)
+    system_prompt, user_prompt = _batch_prompts(hashes, repo_name, commit_blocks, time_window)
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user",  "content": user_prompt},
+    ]
+
+    try:
+        resp = await client.chat(model="llama3", messages=messages, format="json")
     except Exception as e:
-        logger.error(f"Error classifying commit {commit_hash}: {type(e).__name__}: {e}", exc_info=True)
-        fallback = {
-            "commit_hash": commit_hash,
-            "work_type": _heuristic_work_type(commit_msg),
-            "bullet": f"- `[{_heuristic_work_type(commit_msg)}] {commit_hash}`: (summary unavailable) {str(e)}",
-            "team_snippet": "updates",
-        }
-        put_cached(commit_hash, fallback, cache)
-        save_cache(cache)
-        logger.debug(f"Using fallback summary for commit {commit_hash}")
-        return fallback
+        logger.warning(f"Batched classification failed for {repo_name}: {type(e).__name__}: {e}")
+        return None
+
+    return _parse_batch_reply(resp["message"]["content"], hashes, msgs, repo_name)
+
+def classify_and_summarize_commits_batch(
+    commit_blocks: list[str],
+    repo_name: str,
+    since_date: str,
+    to_date: Optional[str],
+    mode: str,
+    client: Optional[Client] = None,
+) -> Optional[list[Dict[str, Any]]]:
+    """
+    Blocking twin of classify_and_summarize_commits_batch_async, for the
+    thread-based journal path. Same contract: one dict per block in input
+    order, or None when the reply can't be aligned.
+    """
+    if not commit_blocks:
+        return []
+
+    hashes = [_extract_commit_hash(b) or "unknown" for b in commit_blocks]
+    msgs = [_extract_commit_message(b) for b in commit_blocks]
+
+    logger.debug(f"Classifying {len(commit_blocks)} commits in {repo_name} (batched)")
+
+    time_window = _time_window_phrase(mode, since_date, to_date)
+    system_prompt, user_prompt = _batch_prompts(hashes, repo_name, commit_blocks, time_window)
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user",  "content": user_prompt},
+    ]
+
+    try:
+        if client is None:
+            client = get_ollama_client()
+        resp = _client_chat(client, model="llama3", messages=messages, format="json")
+    except Exception as e:
+        logger.warning(f"Batched classification failed for {repo_name}: {type(e).__name__}: {e}")
+        return None
+
+    return _parse_batch_reply(resp["message"]["content"], hashes, msgs, repo_name)
+
+def _parse_batch_reply(
+    content: str,
+    hashes: list[str],
+    msgs: list[str],
+    repo_name: str,
+) -> Optional[list[Dict[str, Any]]]:
+    data = _try_parse_json(content)
+    items = data.get("commits") if isinstance(data, dict) else data
+    if not isinstance(items, list) or len(items) != len(hashes):
+        logger.warning(f"Batched reply for {repo_name} is not aligned with its {len(hashes)} commits")
+        return None
+
+    results = []
+    for item, commit_hash, commit_msg in zip(items, hashes, msgs):
+        # A reply naming a different commit means the model reordered or
+        # dropped entries; don't guess which summary belongs where
+        if not isinstance(item, dict) or item.get("commit_hash", commit_hash) != commit_hash:
+            logger.warning(f"Batched reply for {repo_name} is misaligned at commit {commit_hash}")
+            return None
+        results.append(_normalize_commit_data(item, commit_hash, commit_msg))
+    return results
+
+def _chunk_blocks(blocks: list[str], batch_size: int, char_budget: int) -> list[list[str]]:
+    # Cap each batch by count and by prompt size; --stat blocks for large
+    # commits can be long enough to crowd out the rest of the context
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    size = 0
+    for b in blocks:
+        if current and (len(current) >= batch_size or size + len(b) > char_budget):
+            chunks.append(current)
+            current, size = [], 0
+        current.append(b)
+        size += len(b)
+    if current:
+        chunks.append(current)
+    return chunks
+
+def classify_and_summarize_commits(
+    commit_blocks: list[str],
+    repo_name: str,
+    since_date: str,
+    to_date: Optional[str],
+    mode: str,
+    cache_path=None,
+    batch_size: Optional[int] = None,
+) -> list[Dict[str, Any]]:
+    """
+    classify_and_summarize_commit for a whole repo at once: cached commits
+    are resolved with a single cache read, the rest are sent in a few
+    batched prompts (run concurrently) and written back with a single cache
+    write. Any batch whose reply can't be aligned falls back to per-commit
+    calls. batch_size defaults to the configured ollama.batch_size. Returns
+    one dict per block, in input order.
+    """
+    if not commit_blocks:
+        return []
+    if batch_size is None:
+        batch_size = _configured_batch_size()
+
+    cache_path = DEFAULT_CACHE_PATH if cache_path is None else cache_path
+    hashes = [_extract_commit_hash(b) or "unknown" for b in commit_blocks]
+
+    with _cache_lock:
+        cache = load_cache(cache_path)
+        if migrate_cache(cache):
+            save_cache(cache, cache_path)
+
+    results: list[Optional[Dict[str, Any]]] = [None] * len(commit_blocks)
+    pending: list[str] = []
+    for i, (block, commit_hash) in enumerate(zip(commit_blocks, hashes)):
+        cached = get_cached(commit_hash, cache)
+        if cached:
+            CACHE_STATS["hit"] += 1
+            results[i] = cached
+        else:
+            CACHE_STATS["miss"] += 1
+            pending.append(block)
+
+    if pending:
+        logger.debug(f"{len(commit_blocks) - len(pending)} cached, {len(pending)} to summarize for {repo_name}")
+        chunks = _chunk_blocks(pending, max(1, batch_size), BATCH_CHAR_BUDGET)
+        with ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(chunks))) as pool:
+            replies = list(pool.map(
+                lambda chunk: classify_and_summarize_commits_batch(chunk, repo_name, since_date, to_date, mode),
+                chunks,
+            ))
+
+        fresh: Dict[str, Dict[str, Any]] = {}
+        for chunk, reply in zip(chunks, replies):
+            if reply is None:
+                # Sequential per-commit path; it caches its own results
+                reply = [
+                    classify_and_summarize_commit(b, repo_name, since_date, to_date, mode, cache_path)
+                    for b in chunk
+                ]
+            else:
+                fresh.update((d["commit_hash"], d) for d in reply)
+            for d in reply:
+                cache[d["commit_hash"]] = d
+
+        if fresh:
+            _store_cached_many(fresh, cache_path)
+
+        for i, commit_hash in enumerate(hashes):
+            if results[i] is None:
+                results[i] = cache.get(commit_hash)
+
+    # Blocks without a parseable hash all share the "unknown" key; make
+    # sure none of them comes back empty
+    return [
+        r if r is not None else classify_and_summarize_commit(b, repo_name, since_date, to_date, mode, cache_path)
+        for r, b in zip(results, commit_blocks)
+    ]
 
 def generate_repo_standup_paragraph(repo_name: str, time_window: str, bullets: list[str], team_snips: list[str]) -> str:
     """
@@ -482,7 +898,7 @@ def summarize_repo_text_block(
 ) -> Dict[str, Any]:
     """
     Takes the FULL raw text for a repo (multiple commits, separated by '===COMMIT==='),
-    runs per-commit classification & summary (with cache), and returns:
+    runs batched per-commit classification & summary (with cache), and returns:
       {
         "repo_name": repo_name,
         "bullets": [ "...", ... ],
@@ -499,10 +915,7 @@ def summarize_repo_text_block(
 
     logger.debug(f"Processing {len(blocks)} commits for {repo_name}")
 
-    per_commit = [
-        classify_and_summarize_commit(b, repo_name, since_date, to_date, mode)
-        for b in blocks
-    ]
+    per_commit = classify_and_summarize_commits(blocks, repo_name, since_date, to_date, mode)
 
     bullets = [x["bullet"] for x in per_commit if x.get("bullet")]
     team_snips = [x["team_snippet"] for x in per_commit if x.get("team_snippet")]
@@ -10,7 +10,6 @@ from journal.multi_repo_git_utils import (
     get_past_days_date,
     get_first_day_of_month
 )
-from journal.summarize import summarize_git_log, get_ollama_client
 from journal.logging_config import setup_default_logging
 
 logger = logging.getLogger(__name__)
@@ -86,6 +85,8 @@ def summarize(all_projects, root, mode, summarize, output):
             raw_log = get_today_git_summary()
             click.echo("=== Git Activity (Current Repo) ===\n")
             if summarize:
+                from journal.summarize import summarize_git_log
+
                 logger.info("Generating LLM summary for current repo")
                 click.echo(summarize_git_log(raw_log))
             else:
@@ -93,7 +94,12 @@ def summarize(all_projects, root, mode, summarize, output):
 
             if output:
                 logger.info(f"Saving summary to {output}")
-                content = summarize_git_log(raw_log) if summarize else raw_log
+                if summarize:
+                    from journal.summarize import summarize_git_log
+
+                    content = summarize_git_log(raw_log)
+                else:
+                    content = raw_log
                 Path(output).write_text(content)
                 click.echo(f"\n✅ Summary saved to {output}")
 
@@ -117,6 +123,8 @@ def check():
     click.echo("🔍 Checking Ollama setup...\n")
 
     try:
+        from journal.summarize import get_ollama_client
+
         # Test connection and get client
         client = get_ollama_client()
         click.echo("✅ Successfully connected to Ollama server")
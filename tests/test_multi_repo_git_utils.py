@@ -0,0 +1,27 @@
+import subprocess
+
+from journal.multi_repo_git_utils import get_commit_numstats_from_repo
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+def test_numstats_keep_rename_out_of_excluded_dir(tmp_path):
+    # --numstat reports this as "{venv/lib => src}/x.py"; it must be judged
+    # by the new path, like the --name-only scan does
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "venv" / "lib").mkdir(parents=True)
+    (tmp_path / "venv" / "lib" / "x.py").write_text("print(1)\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "add vendored file")
+    (tmp_path / "src").mkdir()
+    _git(tmp_path, "mv", "venv/lib/x.py", "src/x.py")
+    _git(tmp_path, "commit", "-q", "-m", "move x into src")
+
+    for with_stats in (True, False):
+        subjects = [c[1] for c in get_commit_numstats_from_repo(tmp_path, "2000-01-01", with_stats=with_stats)]
+        assert subjects == ["move x into src"]
@@ -0,0 +1,14 @@
+from core.scanner import RepositoryScanner
+from core.types import WorkType
+
+
+def test_heuristic_work_type_non_ascii_subjects():
+    # Non-ASCII letters that casefold to ASCII ("İ", "ſ") used to raise
+    # KeyError and abort the whole scan
+    assert RepositoryScanner._heuristic_work_type("YENİ CİHAZ DESTEĞİ") in set(WorkType)
+    assert RepositoryScanner._heuristic_work_type("ſpec update") in set(WorkType)
+
+
+def test_heuristic_work_type_is_case_insensitive():
+    assert RepositoryScanner._heuristic_work_type("FIX crash") is WorkType.BUGFIX
+    assert RepositoryScanner._heuristic_work_type("Add CI workflow") is WorkType.FEATURE
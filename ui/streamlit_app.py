@@ -437,6 +437,8 @@ def render_controls() -> Optional[Dict[str, Any]]:
         "Summarize with LLM",
         value=st.session_state.config.ollama.enabled,
     )
+    # Off = git lists file names only (faster on big ranges); line counts show as 0
+    line_stats = st.sidebar.checkbox("Collect line statistics", value=True)
 
     st.sidebar.divider()
 
@@ -456,6 +458,7 @@ def render_controls() -> Optional[Dict[str, Any]]:
             "to_date": to_iso,
             "all_projects": all_projects,
             "summarize": summarize_llm,
+            "include_stats": line_stats,
         }
 
     return None
@@ -747,6 +750,7 @@ def run_scan(params: Dict[str, Any]):
             to_date=params["to_date"],
             selected_repos=None,  # Use all repos for now
             progress_callback=update_progress,
+            include_stats=params["include_stats"],
         )
 
         logger.info(f"Scan complete: {len(scan_result.repositories)} repositories")